@@ -4,7 +4,8 @@ Run on Windows:
     python bridge/service.py [--config bridge/config.toml]
 
 Clients (Gamux in WSL2) connect to ws://<host>:<port>/audio and receive
-raw 16-bit PCM audio chunks.
+raw 16-bit PCM audio. Each message carries `batch_chunks` consecutive
+chunks of `chunk_ms` each.
 """
 
 from __future__ import annotations
@@ -13,15 +14,26 @@ import argparse
 import asyncio
 import contextlib
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
 import tomllib
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-WebSocketSet = set[Any]
+AUDIO_RING_SLOTS = 100
+"""Messages buffered between the capture thread and the broadcast loop."""
+
+CLIENT_BACKLOG = 8
+"""Messages a client may leave unsent before new ones are skipped for it."""
+
+MAX_CONSECUTIVE_DROPS = 32
+"""Disconnect a client after this many skipped messages in a row (~2 s of audio)."""
 
 
 @dataclass
@@ -31,6 +43,7 @@ class BridgeConfig:
     sample_rate: int = 16000
     channels: int = 1
     chunk_ms: int = 30
+    batch_chunks: int = 2
     device: str = ""
     reconnect_interval: float = 3.0
     log_level: str = "INFO"
@@ -45,6 +58,7 @@ class BridgeConfig:
             sample_rate=data.get("audio", {}).get("sample_rate", cls.sample_rate),
             channels=data.get("audio", {}).get("channels", cls.channels),
             chunk_ms=data.get("audio", {}).get("chunk_ms", cls.chunk_ms),
+            batch_chunks=data.get("audio", {}).get("batch_chunks", cls.batch_chunks),
             device=data.get("audio", {}).get("device", cls.device),
             reconnect_interval=data.get("service", {}).get(
                 "reconnect_interval", cls.reconnect_interval
@@ -57,59 +71,142 @@ class BridgeConfig:
         return int(self.sample_rate * self.chunk_ms / 1000)
 
 
+class _PcmRing:
+    """Single-producer/single-consumer ring of fixed-size PCM messages.
+
+    The capture thread fills the slot at `write_index()` and calls `commit()`;
+    the broadcast task reads committed slots via `drain()`. Each side only
+    advances its own index, so no lock is needed.
+    """
+
+    def __init__(self, n_slots: int, slot_bytes: int) -> None:
+        self.slots = [bytearray(slot_bytes) for _ in range(n_slots)]
+        self._head = 0  # next slot to read
+        self._tail = 0  # next slot to write
+
+    def write_index(self) -> int | None:
+        """Return the slot to fill next, or None if the reader is a full ring behind."""
+        if self._tail - self._head >= len(self.slots):
+            return None
+        return self._tail % len(self.slots)
+
+    def commit(self) -> None:
+        """Publish the slot at `write_index()` to the reader."""
+        self._tail += 1
+
+    def drain(self) -> Iterator[memoryview]:
+        """Yield committed messages; each slot is released once the next is requested."""
+        while self._head != self._tail:
+            yield memoryview(self.slots[self._head % len(self.slots)])
+            self._head += 1
+
+
 class BridgeServer:
     """WebSocket server that streams microphone audio to connected clients."""
 
     def __init__(self, config: BridgeConfig) -> None:
         self._config = config
-        self._clients: WebSocketSet = set()
-        self._audio_queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=100)
+        self._clients: dict[Any, int] = {}
+        """Connected clients -> consecutive messages skipped for them."""
+        self._clients_snapshot: tuple[Any, ...] = ()
+        """Fan-out order of ``_clients``, rebuilt only on connect/disconnect."""
+        message_bytes = config.chunk_frames * config.batch_chunks * 2
+        self._write_limit = CLIENT_BACKLOG * message_bytes
+        self._ring = _PcmRing(AUDIO_RING_SLOTS, message_bytes)
+        self._audio_ready = asyncio.Event()
         self._running = False
+        self._stopped = threading.Event()
+        """Set whenever the server is not running; the capture thread blocks on it."""
+        self._stopped.set()
 
     async def run(self) -> None:
         """Start server and audio capture concurrently."""
         try:
-            import websockets.server as ws_server
+            import websockets
         except ImportError:
             logger.error("websockets not installed. Run: pip install websockets")
             sys.exit(1)
 
         self._running = True
+        self._stopped.clear()
         logger.info("Bridge server starting on %s:%d", self._config.host, self._config.port)
 
-        async with ws_server.serve(self._handle_client, self._config.host, self._config.port):
-            await asyncio.gather(
-                self._capture_loop(),
-                self._broadcast_loop(),
-            )
+        try:
+            async with websockets.serve(
+                self._handle_client, self._config.host, self._config.port, compression=None
+            ):
+                await asyncio.gather(
+                    self._capture_loop(),
+                    self._broadcast_loop(),
+                )
+        finally:
+            # Lets the capture thread return so the default executor can join it.
+            self.stop()
+
+    def stop(self) -> None:
+        """Stop capture and broadcasting. Call from the event loop thread."""
+        self._running = False
+        self._stopped.set()
+        self._audio_ready.set()
 
     async def _handle_client(self, ws: Any) -> None:
         """Handle a single WebSocket client connection."""
         client_addr = ws.remote_address
         logger.info("Client connected: %s", client_addr)
-        self._clients.add(ws)
+        self._add_client(ws)
         try:
             await ws.wait_closed()
         finally:
-            self._clients.discard(ws)
+            self._remove_client(ws)
             logger.info("Client disconnected: %s", client_addr)
 
+    def _add_client(self, ws: Any) -> None:
+        self._clients[ws] = 0
+        self._clients_snapshot = tuple(self._clients)
+
+    def _remove_client(self, ws: Any) -> None:
+        self._clients.pop(ws, None)
+        self._clients_snapshot = tuple(self._clients)
+
     async def _broadcast_loop(self) -> None:
         """Broadcast audio chunks to all connected clients."""
+        import websockets
+
         while self._running:
-            chunk = await self._audio_queue.get()
-            if not self._clients:
+            await self._audio_ready.wait()
+            self._audio_ready.clear()
+            for message in self._ring.drain():
+                if self._clients_snapshot:
+                    # Frames the message for every client without awaiting any socket.
+                    websockets.broadcast(self._ready_clients(), message)
+
+    def _ready_clients(self) -> Sequence[Any]:
+        """Return clients with room in their write buffer, aborting ones stuck too long.
+
+        While every client keeps up this is the cached snapshot itself, so the
+        common case allocates nothing per message.
+        """
+        clients = self._clients_snapshot
+        ready: list[Any] | None = None
+        for i, ws in enumerate(clients):
+            if ws.transport.get_write_buffer_size() <= self._write_limit:
+                if self._clients[ws]:
+                    self._clients[ws] = 0
+                if ready is not None:
+                    ready.append(ws)
                 continue
-            dead: WebSocketSet = set()
-            for ws in list(self._clients):
-                try:
-                    await ws.send(chunk)
-                except Exception:
-                    dead.add(ws)
-            self._clients -= dead
+            if ready is None:
+                ready = list(clients[:i])
+            drops = self._clients[ws]
+            if drops >= MAX_CONSECUTIVE_DROPS:
+                logger.warning("Client %s stalled, disconnecting.", ws.remote_address)
+                ws.transport.abort()
+            else:
+                self._clients[ws] = drops + 1
+        return clients if ready is None else ready
 
     async def _capture_loop(self) -> None:
-        """Capture microphone audio in executor and push to queue."""
+        """Capture microphone audio in executor and push to the ring."""
         loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._capture_sync, loop)
 
@@ -124,36 +221,77 @@ class BridgeServer:
         cfg = self._config
         device = cfg.device or None
         logger.info(
-            "Audio capture: %dHz, %dch, %dms chunks, device=%s",
+            "Audio capture: %dHz, %dch, %dms chunks x%d per message, device=%s",
             cfg.sample_rate,
             cfg.channels,
             cfg.chunk_ms,
+            cfg.batch_chunks,
             device or "default",
         )
 
+        # Each slot holds one message of `batch_chunks` consecutive chunks.
+        # The raw stream hands us interleaved int16 frames; copying channel 0
+        # is a plain (strided) memoryview copy, so the realtime callback never
+        # allocates or calls into NumPy.
+        ring = self._ring
+        slot_pcm = [memoryview(buf).cast("h") for buf in ring.slots]
+        channels = cfg.channels
+        filled = 0
+
         def callback(indata: Any, frames: int, time: Any, status: Any) -> None:
-            del frames, time
+            nonlocal filled
+            del time
             if status:
                 logger.warning("Audio status: %s", status)
-            import numpy as np
-
-            pcm = (indata[:, 0] * 32767).astype(np.int16)
-            raw = pcm.tobytes()
+            index = ring.write_index()
+            if index is None:
+                return  # broadcast loop is a full ring behind; drop this chunk
+            pcm = slot_pcm[index]
+            pcm[filled : filled + frames] = memoryview(indata).cast("h")[::channels]
+            filled += frames
+            if filled < len(pcm):
+                return
+            filled = 0
+            ring.commit()
             with contextlib.suppress(Exception):
-                loop.call_soon_threadsafe(self._audio_queue.put_nowait, raw)
+                loop.call_soon_threadsafe(self._audio_ready.set)
 
-        with sd.InputStream(
+        with sd.RawInputStream(
             samplerate=cfg.sample_rate,
             channels=cfg.channels,
-            dtype="float32",
+            dtype="int16",
             blocksize=cfg.chunk_frames,
             device=device,
             callback=callback,
         ):
-            while self._running:
-                import time as _time
+            # PortAudio drives the work from its own thread; park until stop().
+            self._stopped.wait()
+
 
-                _time.sleep(0.1)
+class _RawQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records as-is.
+
+    The stock ``prepare()`` formats and copies the record on the emitting
+    thread; the listener's handlers format it anyway, so skip that here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Move the root handlers behind a queue drained by a background thread.
+
+    The capture callback logs from PortAudio's realtime thread; with this in
+    place that is an enqueue, and formatting and stream I/O happen on the
+    listener thread.
+    """
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [_RawQueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 
 def main() -> None:
@@ -174,11 +312,15 @@ def main() -> None:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
+    listener = _start_log_listener()
+
     server = BridgeServer(config)
     try:
         asyncio.run(server.run())
     except KeyboardInterrupt:
         logger.info("Bridge stopped.")
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
@@ -8,31 +8,38 @@ from gamux.actions.registry import ActionHandler
 
 
 async def _switch_pane(ctx: ActionContext) -> None:
-    await ctx.run_tmux("select-pane", "-t", ":.+")
+    # "+" is relative to a window's active pane; a pane ID can't carry it.
+    window = ""
+    if ctx.tmux_pane:
+        rc, stdout, _ = await ctx.run_tmux(
+            "display-message", "-p", "-t", ctx.tmux_pane, "#{window_id}"
+        )
+        window = stdout.strip() if rc == 0 else ""
+    await ctx.run_tmux("select-pane", "-t", f"{window}.+" if window else ":.+")
 
 
 async def _switch_pane_up(ctx: ActionContext) -> None:
-    await ctx.run_tmux("select-pane", "-U")
+    await ctx.run_tmux("select-pane", *ctx.target_args(), "-U")
 
 
 async def _switch_pane_down(ctx: ActionContext) -> None:
-    await ctx.run_tmux("select-pane", "-D")
+    await ctx.run_tmux("select-pane", *ctx.target_args(), "-D")
 
 
 async def _switch_pane_left(ctx: ActionContext) -> None:
-    await ctx.run_tmux("select-pane", "-L")
+    await ctx.run_tmux("select-pane", *ctx.target_args(), "-L")
 
 
 async def _switch_pane_right(ctx: ActionContext) -> None:
-    await ctx.run_tmux("select-pane", "-R")
+    await ctx.run_tmux("select-pane", *ctx.target_args(), "-R")
 
 
 async def _switch_window_next(ctx: ActionContext) -> None:
-    await ctx.run_tmux("next-window")
+    await ctx.run_tmux("next-window", *ctx.target_args())
 
 
 async def _switch_window_prev(ctx: ActionContext) -> None:
-    await ctx.run_tmux("previous-window")
+    await ctx.run_tmux("previous-window", *ctx.target_args())
 
 
 async def _send_enter(ctx: ActionContext) -> None:
@@ -56,20 +63,20 @@ async def _cancel(ctx: ActionContext) -> None:
 
 
 async def _scroll_up(ctx: ActionContext) -> None:
-    await ctx.run_tmux("copy-mode")
-    await ctx.run_tmux("send-keys", "-X", "scroll-up")
+    await ctx.run_tmux("copy-mode", *ctx.target_args())
+    await ctx.run_tmux("send-keys", *ctx.target_args(), "-X", "scroll-up")
 
 
 async def _scroll_down(ctx: ActionContext) -> None:
-    await ctx.run_tmux("send-keys", "-X", "scroll-down")
+    await ctx.run_tmux("send-keys", *ctx.target_args(), "-X", "scroll-down")
 
 
 async def _copy_mode(ctx: ActionContext) -> None:
-    await ctx.run_tmux("copy-mode")
+    await ctx.run_tmux("copy-mode", *ctx.target_args())
 
 
 async def _paste(ctx: ActionContext) -> None:
-    await ctx.run_tmux("paste-buffer")
+    await ctx.run_tmux("paste-buffer", *ctx.target_args())
 
 
 async def _ptt_start(ctx: ActionContext) -> None:
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from gamux import tmux
+
 if TYPE_CHECKING:
     from gamux.config import AppConfig
 
@@ -31,23 +32,18 @@ class ActionContext:
         *args: str,
         timeout: float | None = None,
     ) -> tuple[int, str, str]:
-        """Run a tmux command. Returns (returncode, stdout, stderr)."""
+        """Run a tmux command via `gamux.tmux.run`. Returns (returncode, stdout, stderr).
+
+        On the control connection tmux runs the command as gamux's own client,
+        so commands meant for the user's pane, window or session must name it
+        (see `target_args`).
+        """
         effective_timeout = timeout if timeout is not None else self.config.tmux.command_timeout
-        proc = await asyncio.create_subprocess_exec(
-            "tmux",
-            *args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        try:
-            stdout_b, stderr_b = await asyncio.wait_for(
-                proc.communicate(), timeout=effective_timeout
-            )
-        except TimeoutError as exc:
-            proc.kill()
-            await proc.communicate()
-            raise TimeoutError(f"tmux {args[0]!r} timed out after {effective_timeout}s") from exc
-        return proc.returncode or 0, stdout_b.decode(), stderr_b.decode()
+        return await tmux.run(*args, timeout=effective_timeout)
+
+    def target_args(self) -> tuple[str, ...]:
+        """``("-t", tmux_pane)``, or nothing when the pane is unknown."""
+        return ("-t", self.tmux_pane) if self.tmux_pane else ()
 
     async def send_keys(self, keys: str, target: str | None = None) -> None:
         """Send keys to a tmux pane."""
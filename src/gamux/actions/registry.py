@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
+from functools import lru_cache
 
 from gamux.actions.context import ActionContext
 from gamux.actions.names import ActionName
@@ -13,19 +14,32 @@ logger = logging.getLogger(__name__)
 ActionHandler = Callable[[ActionContext], Awaitable[None]]
 
 
+@lru_cache(maxsize=128)
+def _name_of(action_str: str) -> ActionName | None:
+    """Coerce a binding string to ActionName, or None if it names no action."""
+    try:
+        return ActionName(action_str)
+    except ValueError:
+        return None
+
+
 class ActionRegistry:
     """Maps ActionName -> async handler. Supports string lookup for config bindings."""
 
     def __init__(self) -> None:
         self._handlers: dict[ActionName, ActionHandler] = {}
+        self._by_string: dict[str, ActionHandler] = {}
+        """Same handlers keyed by raw action string, for binding dispatch."""
 
     def register(self, name: ActionName, handler: ActionHandler) -> None:
         """Register a handler for an action."""
         self._handlers[name] = handler
+        self._by_string[name.value] = handler
 
     def register_all(self, handlers: dict[ActionName, ActionHandler]) -> None:
         """Register multiple handlers at once."""
         self._handlers.update(handlers)
+        self._by_string.update((name.value, handler) for name, handler in handlers.items())
 
     def has(self, name: ActionName) -> bool:
         """Return True if a handler is registered for this action."""
@@ -37,6 +51,32 @@ class ActionRegistry:
         if handler is None:
             logger.warning("No handler registered for action: %s", name)
             return False
+        return await self.invoke(name, handler, ctx)
+
+    def resolve(self, action_str: str) -> ActionHandler | None:
+        """Resolve a binding string to its handler. Logs warning for unknown names."""
+        handler = self._by_string.get(action_str)
+        if handler is not None:
+            return handler
+        name = _name_of(action_str)
+        if name is None:
+            logger.warning("Unknown action name in binding: %r", action_str)
+            return None
+        handler = self._handlers.get(name)
+        if handler is None:
+            logger.warning("No handler registered for action: %s", name)
+        return handler
+
+    async def dispatch_by_string(self, action_str: str, ctx: ActionContext) -> bool:
+        """Dispatch by string name (from config bindings). Logs warning for unknown names."""
+        handler = self.resolve(action_str)
+        if handler is None:
+            return False
+        return await self.invoke(action_str, handler, ctx)
+
+    @staticmethod
+    async def invoke(name: str, handler: ActionHandler, ctx: ActionContext) -> bool:
+        """Run a resolved handler, logging (not raising) its errors. Returns True on success."""
         try:
             await handler(ctx)
             return True
@@ -44,15 +84,6 @@ class ActionRegistry:
             logger.exception("Error in action handler: %s", name)
             return False
 
-    async def dispatch_by_string(self, action_str: str, ctx: ActionContext) -> bool:
-        """Dispatch by string name (from config bindings). Logs warning for unknown names."""
-        try:
-            name = ActionName(action_str)
-        except ValueError:
-            logger.warning("Unknown action name in binding: %r", action_str)
-            return False
-        return await self.dispatch(name, ctx)
-
     @classmethod
     def with_builtins(cls) -> ActionRegistry:
         """Create a registry pre-loaded with all built-in handlers."""
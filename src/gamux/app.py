@@ -4,10 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
 import gamux.tmux as tmux
 from gamux.actions.context import ActionContext
-from gamux.actions.registry import ActionRegistry
+from gamux.actions.names import ActionName
+from gamux.actions.registry import ActionHandler, ActionRegistry
 from gamux.config import AppConfig
 from gamux.controller.buttons import ButtonName
 from gamux.controller.reader import AnalogEvent, ButtonEvent, ControllerReader
@@ -18,6 +20,22 @@ from gamux.voice.vad import VADConfig, VoiceActivityDetector
 
 logger = logging.getLogger(__name__)
 
+CONTEXT_TTL = 0.2
+"""Seconds a probed tmux pane/session is reused before asking tmux again."""
+
+# Actions after which the cached pane/session is stale.
+_FOCUS_ACTIONS = frozenset(
+    {
+        ActionName.SWITCH_PANE,
+        ActionName.SWITCH_PANE_UP,
+        ActionName.SWITCH_PANE_DOWN,
+        ActionName.SWITCH_PANE_LEFT,
+        ActionName.SWITCH_PANE_RIGHT,
+        ActionName.SWITCH_WINDOW_NEXT,
+        ActionName.SWITCH_WINDOW_PREV,
+    }
+)
+
 
 class App:
     """Main Gamux application."""
@@ -31,15 +49,22 @@ class App:
         self._vad = VoiceActivityDetector(
             VADConfig(
                 threshold=config.voice.vad_threshold,
+                mu=config.voice.vad_mu,
                 silence_duration_ms=config.voice.silence_duration_ms,
             )
         )
+        self._bindings = self._compile_bindings(config)
+        """(PTT held, button) -> (action name, handler), resolved once from config."""
+        self._tmux_control = tmux.control()
         self._controller: ControllerReader | None = None
         self._ptt_active = False
         self._ptt_audio: list[object] = []
+        self._ctx_cache: tuple[float, str, str] | None = None
+        """(probe time, pane, session) from the last tmux probe."""
 
     async def setup(self) -> None:
         """Initialize all subsystems."""
+        await self._start_tmux_control()
         await self._status.set("loading model...")
         self._recognizer.set_transcript_callback(self._on_transcript)
         await self._recognizer.load_model()
@@ -55,6 +80,7 @@ class App:
             source = BridgeSource(
                 host=self._config.bridge.host,
                 port=self._config.bridge.port,
+                reconnect_interval=self._config.bridge.reconnect_interval,
             )
         else:
             source = LocalSource(device=self._config.voice.device)
@@ -73,6 +99,7 @@ class App:
         await self._recognizer.shutdown()
         await self._rumble.stop()
         await self._status.clear()
+        await self._tmux_control.stop()
         logger.info("Gamux shut down.")
 
     # --- Controller ---
@@ -101,14 +128,15 @@ class App:
         if not event.pressed:
             return
 
-        # Build binding key e.g. "ZL_A"
-        binding_key = f"ZL_{event.button}" if self._ptt_active else str(event.button)
-        action_str = self._config.bindings.get(binding_key)
-        if action_str is None:
+        binding = self._bindings.get((self._ptt_active, event.button))
+        if binding is None:
             return
 
+        action_str, handler = binding
         ctx = await self._make_context()
-        await self._registry.dispatch_by_string(action_str, ctx)
+        await self._registry.invoke(action_str, handler, ctx)
+        if action_str in _FOCUS_ACTIONS:
+            self._ctx_cache = None
 
     async def _on_analog(self, event: AnalogEvent) -> None:
         del event
@@ -117,8 +145,6 @@ class App:
     # --- Audio / Voice ---
 
     async def _audio_loop(self, source: object) -> None:
-        import numpy as np
-
         from gamux.voice.source import AudioSource
 
         if not isinstance(source, AudioSource):
@@ -129,9 +155,8 @@ class App:
                 continue
 
             result = self._vad.process(chunk)
-            if result.speech_ended and result.audio_buffer:
-                audio = np.concatenate(result.audio_buffer)
-                await self._recognizer.transcribe(audio)
+            if result.speech_ended and result.audio.size:
+                await self._recognizer.transcribe(result.audio)
 
     async def _on_transcript(self, text: str) -> None:
         logger.info("Transcript: %s", text)
@@ -143,11 +168,37 @@ class App:
 
     # --- Helpers ---
 
+    def _compile_bindings(
+        self, config: AppConfig
+    ) -> dict[tuple[bool, ButtonName], tuple[str, ActionHandler]]:
+        """Resolve every bound action name to its handler up front."""
+        compiled: dict[tuple[bool, ButtonName], tuple[str, ActionHandler]] = {}
+        for (ptt, button), action_str in config.binding_index.items():
+            handler = self._registry.resolve(action_str)
+            if handler is not None:
+                compiled[(ptt, button)] = (action_str, handler)
+        return compiled
+
     async def _make_context(self) -> ActionContext:
+        now = time.monotonic()
+        if self._ctx_cache is not None and now - self._ctx_cache[0] < CONTEXT_TTL:
+            _, pane, session = self._ctx_cache
+        else:
+            # Probe concurrently; a failed probe only blanks its own field.
+            probes = await asyncio.gather(
+                tmux.current_pane(), tmux.current_session(), return_exceptions=True
+            )
+            pane, session = (p if isinstance(p, str) else "" for p in probes)
+            self._ctx_cache = (now, pane, session)
+        return ActionContext(
+            config=self._config,
+            tmux_pane=pane,
+            tmux_session=session,
+        )
+
+    async def _start_tmux_control(self) -> None:
         try:
-            pane = await tmux.current_pane()
             session = await tmux.current_session()
-        except Exception:  # pragma: no cover - tmux availability is environment dependent
-            pane = ""
-            session = ""
-        return ActionContext(config=self._config, tmux_pane=pane, tmux_session=session)
+            await self._tmux_control.start(session, timeout=self._config.tmux.command_timeout)
+        except Exception as e:  # pragma: no cover - tmux availability is environment dependent
+            logger.info("tmux control mode unavailable, spawning tmux per command: %s", e)
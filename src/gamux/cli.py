@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import json
 import logging
+from collections.abc import Callable
 from pathlib import Path
 from typing import Annotated
 
@@ -50,8 +51,11 @@ def run(
         finally:
             await application.shutdown()
 
-    with contextlib.suppress(KeyboardInterrupt):
-        asyncio.run(_main())
+    with (
+        contextlib.suppress(KeyboardInterrupt),
+        asyncio.Runner(loop_factory=_loop_factory()) as runner,
+    ):
+        runner.run(_main())
 
 
 # --- Doctor ---
@@ -296,6 +300,15 @@ def calibrate(
 # --- Helpers ---
 
 
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return uvloop's loop constructor if installed, else None (stock asyncio loop)."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:  # optional; the stock event loop works the same, just slower
+        return None
+    return uvloop.new_event_loop  # type: ignore[no-any-return]
+
+
 def _setup_logging(debug: bool) -> None:
     level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(
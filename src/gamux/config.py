@@ -2,12 +2,30 @@
 
 from __future__ import annotations
 
+import logging
 import tomllib
+from collections.abc import Callable
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+if TYPE_CHECKING:
+    from gamux.controller.buttons import ButtonName
+
+try:
+    import rtoml  # type: ignore[import-not-found]
+
+    _toml_loads: Callable[[str], dict[str, Any]] = rtoml.loads
+except ImportError:  # optional Rust-backed parser; stdlib is the fallback
+    _toml_loads = tomllib.loads
+
+logger = logging.getLogger(__name__)
+
+PTT_PREFIX = "ZL_"
+"""Binding-key prefix for chords held with the push-to-talk button."""
+
 
 class ControllerConfig(BaseModel):
     model_config = ConfigDict(frozen=True)
@@ -29,6 +47,12 @@ class VoiceConfig(BaseModel):
     compute_type: Literal["int8", "float16", "float32"] = "int8"
     beam_size: Annotated[int, Field(ge=1, le=20)] = 5
     vad_threshold: Annotated[float, Field(ge=0.0, le=1.0)] = 0.5
+    vad_mu: Annotated[float, Field(ge=0.0, le=1.0)] = 0.4
+    """Fraction of the recent peak RMS speech must reach (0 = fixed threshold only).
+
+    Rejects audio much quieter than recent speech; steady noise above
+    vad_threshold still counts as speech.
+    """
     silence_duration_ms: Annotated[int, Field(ge=100, le=5000)] = 500
     device: str = "auto"
     """Audio input device name or 'auto'."""
@@ -72,24 +96,39 @@ class AppConfig(BaseModel):
     @field_validator("bindings")
     @classmethod
     def bindings_not_empty_values(cls, v: dict[str, str]) -> dict[str, str]:
-        for key, action in v.items():
-            if not action.strip():
-                raise ValueError(f"Binding '{key}' has an empty action name.")
-        return v
+        return _check_bindings(v)
+
+    @cached_property
+    def binding_index(self) -> dict[tuple[bool, ButtonName], str]:
+        """Bindings keyed by (PTT held, button), parsed once from keys like "ZL_A"."""
+        from gamux.controller.buttons import ButtonName  # controller imports config
+
+        index: dict[tuple[bool, ButtonName], str] = {}
+        for key, action in self.bindings.items():
+            ptt = key.startswith(PTT_PREFIX)
+            try:
+                button = ButtonName(key.removeprefix(PTT_PREFIX))
+            except ValueError:
+                logger.warning("Unknown button in binding: %r", key)
+                continue
+            index[(ptt, button)] = action
+        return index
 
     @classmethod
     def load(cls, path: Path | None = None) -> AppConfig:
-        """Load config from TOML file. Uses defaults if file not found."""
+        """Load config from TOML file. Uses defaults if file not found.
+
+        The validated result is reused while the file's mtime and size are
+        unchanged (configs are frozen, so sharing one instance is safe).
+        """
         from gamux.paths import default_config_path
 
         config_path = path or default_config_path()
         if not config_path.exists():
             return cls()
 
-        with config_path.open("rb") as f:
-            data = tomllib.load(f)
-
-        return cls.model_validate(data)
+        st = config_path.stat()
+        return _load_validated(str(config_path), st.st_mtime_ns, st.st_size)
 
     @classmethod
     def load_with_override(
@@ -100,27 +139,62 @@ class AppConfig(BaseModel):
         """Load base config, then merge override TOML on top."""
         from gamux.paths import default_config_path
 
+        if not (override and override.exists()):
+            return cls.load(base)
+
         base_path = base or default_config_path()
         base_data: dict[str, object] = {}
         if base_path.exists():
-            with base_path.open("rb") as f:
-                base_data = tomllib.load(f)
+            base_data = _read_toml(base_path)
+        return cls.model_validate(_deep_merge(base_data, _read_toml(override)))
 
-        if override and override.exists():
-            with override.open("rb") as f:
-                override_data = tomllib.load(f)
-            base_data = _deep_merge(base_data, override_data)
 
-        return cls.model_validate(base_data)
+def _read_toml(path: Path) -> dict[str, Any]:
+    """Parse a TOML file, reusing the last parse while its mtime and size are unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = path.stat()
+    return _read_toml_cached(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_validated(path: str, mtime_ns: int, size: int) -> AppConfig:
+    return AppConfig.model_validate(_read_toml_cached(path, mtime_ns, size))
+
+
+@lru_cache(maxsize=8)
+def _read_toml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    del mtime_ns, size  # cache key only
+    # Configs are tiny: one read beats streaming through the parser.
+    return _toml_loads(Path(path).read_bytes().decode())
+
+
+def _check_bindings(bindings: dict[str, str]) -> dict[str, str]:
+    """Reject bindings with an empty action name."""
+    for key, action in bindings.items():
+        if not action.strip():
+            raise ValueError(f"Binding '{key}' has an empty action name.")
+    return bindings
 
 
 def _deep_merge(base: dict[str, object], override: dict[str, object]) -> dict[str, object]:
-    """Recursively merge override into base."""
+    """Deep-merge override into base with an explicit stack, returning a new dict.
+
+    Inputs are not modified; only the tables both sides define are copied.
+    ``type() is dict`` is exact for parsed TOML and cheaper than ``isinstance``.
+    """
     result: dict[str, object] = dict(base)
-    for key, value in override.items():
-        base_value = result.get(key)
-        if isinstance(base_value, dict) and isinstance(value, dict):
-            result[key] = _deep_merge(base_value, value)
-        else:
-            result[key] = value
+    stack: list[tuple[dict[str, object], dict[str, object]]] = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if type(current) is dict and type(value) is dict:
+                if value:  # an empty override table changes nothing
+                    merged: dict[str, object] = dict(current)
+                    dst[key] = merged
+                    stack.append((merged, value))
+            else:
+                dst[key] = value
     return result
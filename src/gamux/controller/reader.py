@@ -6,9 +6,10 @@ import asyncio
 import contextlib
 import logging
 from collections.abc import AsyncIterator
-from dataclasses import dataclass
+from typing import NamedTuple
 
 import evdev
+import numpy as np
 
 from gamux.config import ControllerConfig
 from gamux.controller.buttons import (
@@ -22,17 +23,28 @@ from gamux.controller.buttons import (
 
 logger = logging.getLogger(__name__)
 
+_INV_MAX_RANGE = 1.0 / 32767.0
+"""Scale from a centred raw stick value to [-1.0, 1.0]."""
+_RAW_MIN, _RAW_MAX = -32768, 32767
+"""Raw axis range covered by the normalization lookup tables."""
 
-@dataclass(frozen=True)
-class ButtonEvent:
+# evdev codes checked per event, bound once instead of evdev.ecodes.* lookups.
+_EV_KEY = evdev.ecodes.EV_KEY
+_EV_ABS = evdev.ecodes.EV_ABS
+_ABS_HAT0X = evdev.ecodes.ABS_HAT0X
+_ABS_HAT0Y = evdev.ecodes.ABS_HAT0Y
+
+
+# Events are NamedTuples: immutable like a frozen dataclass, but cheaper to
+# construct, which matters at evdev's event rate.
+class ButtonEvent(NamedTuple):
     """A button press or release event."""
 
     button: ButtonName
     pressed: bool  # True = pressed, False = released
 
 
-@dataclass(frozen=True)
-class AnalogEvent:
+class AnalogEvent(NamedTuple):
     """An analog stick movement event."""
 
     axis: AnalogAxis
@@ -46,6 +58,44 @@ class AnalogEvent:
 ControllerEvent = ButtonEvent | AnalogEvent
 
 
+def _dpad_transition(
+    previous: ButtonName | None, new: ButtonName | None
+) -> tuple[ButtonEvent, ...]:
+    """Release the previously held direction (if any), then press the new one."""
+    events: list[ButtonEvent] = []
+    if previous is not None:
+        events.append(ButtonEvent(button=previous, pressed=False))
+    if new is not None:
+        events.append(ButtonEvent(button=new, pressed=True))
+    return tuple(events)
+
+
+def _dpad_table(
+    value_map: dict[int, ButtonName | None],
+) -> dict[tuple[ButtonName | None, int], tuple[ButtonEvent, ...]]:
+    """Events to emit for every (held direction, incoming hat value) pair."""
+    held: list[ButtonName | None] = [None, *(b for b in value_map.values() if b is not None)]
+    return {
+        (previous, value): _dpad_transition(previous, new)
+        for previous in held
+        for value, new in value_map.items()
+    }
+
+
+_KEY_EVENTS: list[tuple[ButtonEvent, ButtonEvent] | None] = [
+    (ButtonEvent(button, False), ButtonEvent(button, True)) if button is not None else None
+    for button in map(BUTTON_CODE_MAP.get, range(evdev.ecodes.KEY_CNT))
+]
+"""(released, pressed) events per EV_KEY code; a list index is cheaper than a dict lookup."""
+_AXIS_BY_CODE: list[AnalogAxis | None] = list(map(AXIS_CODE_MAP.get, range(evdev.ecodes.ABS_CNT)))
+"""Analog axis per EV_ABS code."""
+
+_DPAD_X_TABLE = _dpad_table(DPAD_X_MAP)
+"""Pre-built d-pad X transitions; the events are shared, immutable tuples."""
+_DPAD_Y_TABLE = _dpad_table(DPAD_Y_MAP)
+"""Pre-built d-pad Y transitions."""
+
+
 class ControllerReader:
     """Reads events from a game controller via evdev.
 
@@ -67,14 +117,33 @@ class ControllerReader:
     def __init__(self, config: ControllerConfig) -> None:
         self._config = config
         self._device: evdev.InputDevice[str] | None = None
-        self._queue: asyncio.Queue[ControllerEvent | None] = asyncio.Queue()
-        self._read_task: asyncio.Task[None] | None = None
         self._running = False
+        self._readable = asyncio.Event()
         self._dpad_x: ButtonName | None = None  # currently pressed dpad X
         self._dpad_y: ButtonName | None = None  # currently pressed dpad Y
+        # Analog normalization constants, fixed for the reader's lifetime.
+        self._neutral_by_axis = {
+            AnalogAxis.LEFT_X: config.stick_neutral_x,
+            AnalogAxis.LEFT_Y: config.stick_neutral_y,
+            AnalogAxis.RIGHT_X: config.stick_neutral_x,
+            AnalogAxis.RIGHT_Y: config.stick_neutral_y,
+        }
+        self._deadzone = config.stick_deadzone
+        self._inv_live = 1.0 / (1.0 - self._deadzone) if self._deadzone < 1.0 else 0.0
+        """1 / width of the range outside the deadzone."""
+        # X axes share one table and Y axes the other (per-axis neutrals).
+        lut_x = self._build_lut(config.stick_neutral_x)
+        lut_y = self._build_lut(config.stick_neutral_y)
+        self._lut_by_axis = {
+            AnalogAxis.LEFT_X: lut_x,
+            AnalogAxis.LEFT_Y: lut_y,
+            AnalogAxis.RIGHT_X: lut_x,
+            AnalogAxis.RIGHT_Y: lut_y,
+        }
+        """Normalized value for every int16 raw value, indexed by ``raw - _RAW_MIN``."""
 
     async def start(self) -> None:
-        """Open the device and start reading events."""
+        """Open the device; events are read as :meth:`events` is iterated."""
         device_path = self._config.device_path or self._find_device()
         if not device_path:
             raise RuntimeError(
@@ -89,20 +158,13 @@ class ControllerReader:
             logger.info("Controller grabbed exclusively.")
 
         self._running = True
-        self._read_task = asyncio.create_task(self._read_loop(), name="controller-reader")
 
     async def stop(self) -> None:
-        """Stop reading and release the device."""
+        """Stop reading and release the device; a waiting :meth:`events` ends."""
         self._running = False
-        await self._queue.put(None)  # sentinel
-
-        if self._read_task is not None:
-            self._read_task.cancel()
-            with contextlib.suppress(asyncio.CancelledError):
-                await self._read_task
-            self._read_task = None
-
+        self._readable.set()
         if self._device is not None:
+            asyncio.get_running_loop().remove_reader(self._device.fd)
             if self._config.grab:
                 with contextlib.suppress(OSError):
                     self._device.ungrab()
@@ -111,12 +173,46 @@ class ControllerReader:
             logger.info("Controller released.")
 
     async def events(self) -> AsyncIterator[ControllerEvent]:
-        """Async iterator yielding controller events."""
-        while True:
-            event = await self._queue.get()
-            if event is None:
-                break
-            yield event
+        """Async iterator yielding controller events.
+
+        Each wakeup drains every pending event with one non-blocking
+        ``device.read()`` and maps them synchronously, so there is one await
+        per batch rather than one future per event (as with
+        ``async_read_loop``), and no queue between device and consumer.
+        Within a batch only the newest sample of each stick axis is yielded
+        (at its own position); earlier ones are already stale. Buttons and
+        d-pad transitions are never coalesced.
+        """
+        device = self._device
+        if device is None:
+            return
+        loop = asyncio.get_running_loop()
+        ev_key, ev_abs, axis_by_code = _EV_KEY, _EV_ABS, _AXIS_BY_CODE
+        while self._running:
+            try:
+                batch = list(device.read())
+                # Newest EV_ABS event per code; only consulted for stick axes.
+                newest = (
+                    {ev.code: ev for ev in batch if ev.type == ev_abs} if len(batch) > 1 else {}
+                )
+                for ev in batch:
+                    if ev.type == ev_key:
+                        button_event = self._map_key(ev)
+                        if button_event is not None:
+                            yield button_event
+                    elif ev.type == ev_abs:
+                        if (
+                            newest
+                            and axis_by_code[ev.code] is not None
+                            and newest[ev.code] is not ev
+                        ):
+                            continue  # superseded later in this batch
+                        for event in self._map_abs(ev):
+                            yield event
+            except BlockingIOError:
+                await self._wait_readable(loop, device.fd)
+            except OSError:
+                return  # device closed by stop() or unplugged
 
     async def __aenter__(self) -> ControllerReader:
         await self.start()
@@ -127,86 +223,119 @@ class ControllerReader:
 
     # --- Internal ---
 
+    async def _wait_readable(self, loop: asyncio.AbstractEventLoop, fd: int) -> None:
+        """Sleep until *fd* has input or :meth:`stop` is called."""
+        if not self._running:
+            return
+        self._readable.clear()
+        loop.add_reader(fd, self._readable.set)
+        try:
+            await self._readable.wait()
+        finally:
+            loop.remove_reader(fd)
+
     def _find_device(self) -> str | None:
-        """Auto-detect the first gamepad/joystick device."""
+        """Auto-detect the first gamepad/joystick device.
+
+        Asks udev for joystick event nodes when pyudev is installed, so only
+        those are opened; otherwise (or if none of them qualifies) every input
+        device is. Either way a device must open and report BTN_SOUTH/BTN_A.
+        """
+        return self._find_device_udev() or self._scan_devices()
+
+    @classmethod
+    def _find_device_udev(cls) -> str | None:
+        try:
+            import pyudev  # type: ignore[import-not-found]
+
+            context = pyudev.Context()
+        except (ImportError, OSError):  # optional; no pyudev or no libudev
+            return None
+        for device in context.list_devices(subsystem="input", ID_INPUT_JOYSTICK="1"):
+            node = device.device_node
+            if device.sys_name.startswith("event") and node and cls._is_gamepad(str(node)):
+                return str(node)
+        return None
+
+    @classmethod
+    def _scan_devices(cls) -> str | None:
         for path in evdev.list_devices():
-            try:
-                dev = evdev.InputDevice(path)
-                caps = dev.capabilities(verbose=True)
-                # Check for EV_KEY with BTN_SOUTH (typical gamepad indicator)
-                key_caps = caps.get(("EV_KEY", 1), [])
-                dev.close()
-                if any("BTN_SOUTH" in str(k) or "BTN_A" in str(k) for k in key_caps):
-                    return path
-            except (PermissionError, OSError):
-                continue
+            if cls._is_gamepad(path):
+                return path
         return None
 
+    @staticmethod
+    def _is_gamepad(path: str) -> bool:
+        """True if *path* opens and has EV_KEY BTN_SOUTH/BTN_A (typical gamepad indicator)."""
+        try:
+            dev = evdev.InputDevice(path)
+            caps = dev.capabilities(verbose=True)
+            key_caps = caps.get(("EV_KEY", 1), [])
+            dev.close()
+        except (PermissionError, OSError):
+            return False
+        return any("BTN_SOUTH" in str(k) or "BTN_A" in str(k) for k in key_caps)
+
     def _normalize(self, value: int, axis: AnalogAxis) -> float:
         """Normalize raw axis value to [-1.0, 1.0] with deadzone."""
-        neutral_x = self._config.stick_neutral_x
-        neutral_y = self._config.stick_neutral_y
-        neutral = neutral_y if axis in (AnalogAxis.LEFT_Y, AnalogAxis.RIGHT_Y) else neutral_x
-
-        centered = value - neutral
-        max_range = 32767.0
-        normalized = centered / max_range
-        normalized = max(-1.0, min(1.0, normalized))
-
-        deadzone = self._config.stick_deadzone
-        if abs(normalized) < deadzone:
+        if _RAW_MIN <= value <= _RAW_MAX:
+            return float(self._lut_by_axis[axis][value - _RAW_MIN])
+        return self._normalize_uncached(value, axis)
+
+    def _normalize_uncached(self, value: int, axis: AnalogAxis) -> float:
+        """Reference formula, for raw values outside the int16 lookup table."""
+        normalized = (value - self._neutral_by_axis[axis]) * _INV_MAX_RANGE
+        magnitude = abs(normalized)
+        if magnitude < self._deadzone:
             return 0.0
-        # Scale so deadzone edge = 0.0 and max = 1.0
         sign = 1.0 if normalized > 0 else -1.0
-        return sign * (abs(normalized) - deadzone) / (1.0 - deadzone)
-
-    async def _read_loop(self) -> None:
-        """Main event reading loop."""
-        if self._device is None:
-            return
-        try:
-            async for ev in self._device.async_read_loop():
-                if not self._running:
-                    break
-
-                if ev.type == evdev.ecodes.EV_KEY:
-                    await self._handle_key(ev)
-                elif ev.type == evdev.ecodes.EV_ABS:
-                    await self._handle_abs(ev)
-
-        except (OSError, asyncio.CancelledError):
-            pass
-        finally:
-            await self._queue.put(None)
-
-    async def _handle_key(self, ev: evdev.InputEvent) -> None:
-        button = BUTTON_CODE_MAP.get(ev.code)
-        if button is None:
-            return
-        pressed = ev.value == 1
-        await self._queue.put(ButtonEvent(button=button, pressed=pressed))
-
-    async def _handle_abs(self, ev: evdev.InputEvent) -> None:
+        if magnitude >= 1.0:
+            return sign  # clamped; exact, and safe for a deadzone of 1.0
+        # Scale so deadzone edge = 0.0 and max = 1.0
+        return sign * (magnitude - self._deadzone) * self._inv_live
+
+    def _build_lut(self, neutral: int) -> np.ndarray:
+        """Vectorized :meth:`_normalize_uncached` over the whole int16 range.
+
+        Same float64 operations in the same order, so every entry is
+        bit-identical to the scalar formula. Kept as a float64 array (512 KiB);
+        a list of boxed floats would cost about four times that per table.
+        """
+        normalized = (
+            np.arange(_RAW_MIN, _RAW_MAX + 1, dtype=np.float64) - neutral
+        ) * _INV_MAX_RANGE
+        magnitude = np.abs(normalized)
+        sign = np.where(normalized > 0, 1.0, -1.0)
+        scaled = sign * (magnitude - self._deadzone) * self._inv_live
+        lut: np.ndarray = np.where(
+            magnitude < self._deadzone, 0.0, np.where(magnitude >= 1.0, sign, scaled)
+        )
+        return lut
+
+    def _map_key(self, ev: evdev.InputEvent) -> ButtonEvent | None:
+        events = _KEY_EVENTS[ev.code]
+        if events is None:
+            return None
+        return events[ev.value == 1]  # autorepeat (2) reads as released, as before
+
+    def _map_abs(self, ev: evdev.InputEvent) -> tuple[ControllerEvent, ...]:
         # Analog axes
-        axis = AXIS_CODE_MAP.get(ev.code)
+        axis = _AXIS_BY_CODE[ev.code]
         if axis is not None:
             normalized = self._normalize(ev.value, axis)
-            await self._queue.put(AnalogEvent(axis=axis, value=ev.value, normalized=normalized))
-            return
+            return (AnalogEvent(axis=axis, value=ev.value, normalized=normalized),)
 
         # D-pad (HAT)
-        if ev.code == evdev.ecodes.ABS_HAT0X:
-            new_btn = DPAD_X_MAP.get(ev.value)
-            if self._dpad_x is not None:
-                await self._queue.put(ButtonEvent(button=self._dpad_x, pressed=False))
-            self._dpad_x = new_btn
-            if new_btn is not None:
-                await self._queue.put(ButtonEvent(button=new_btn, pressed=True))
-
-        elif ev.code == evdev.ecodes.ABS_HAT0Y:
-            new_btn = DPAD_Y_MAP.get(ev.value)
-            if self._dpad_y is not None:
-                await self._queue.put(ButtonEvent(button=self._dpad_y, pressed=False))
-            self._dpad_y = new_btn
-            if new_btn is not None:
-                await self._queue.put(ButtonEvent(button=new_btn, pressed=True))
+        if ev.code == _ABS_HAT0X:
+            events = _DPAD_X_TABLE.get((self._dpad_x, ev.value))
+            if events is None:  # out-of-range hat value: treat as centred
+                events = _dpad_transition(self._dpad_x, None)
+            self._dpad_x = DPAD_X_MAP.get(ev.value)
+            return events
+        if ev.code == _ABS_HAT0Y:
+            events = _DPAD_Y_TABLE.get((self._dpad_y, ev.value))
+            if events is None:
+                events = _dpad_transition(self._dpad_y, None)
+            self._dpad_y = DPAD_Y_MAP.get(ev.value)
+            return events
+        return ()
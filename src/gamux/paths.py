@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import os
+import re
+import socket
 import subprocess
+import sys
 import tempfile
 from functools import lru_cache
 from pathlib import Path
@@ -35,32 +38,61 @@ def default_config_path() -> Path:
     return config_dir() / "config.toml"
 
 
+_PROC_ROUTE = Path("/proc/net/route")
+"""Kernel IPv4 routing table; read instead of spawning ``ip route``."""
+
+
 @lru_cache(maxsize=1)
 def wsl_gateway() -> str | None:
     """Detect the WSL2 host gateway IP. Returns None if not in WSL2."""
+    try:
+        table = _PROC_ROUTE.read_text()
+    except OSError:
+        return _gateway_from_ip_route()
+    return _gateway_from_proc_route(table)
+
+
+def _gateway_from_proc_route(table: str) -> str | None:
+    """Return the gateway of the lowest-metric default route in /proc/net/route."""
+    best: tuple[int, str] | None = None
+    for line in table.splitlines()[1:]:
+        fields = line.split()
+        if len(fields) < 7 or fields[1] != "00000000":
+            continue
+        try:
+            gateway = int(fields[2], 16)
+            metric = int(fields[6])
+        except ValueError:
+            continue
+        if gateway and (best is None or metric < best[0]):
+            # Fields are hex in host byte order.
+            best = (metric, socket.inet_ntoa(gateway.to_bytes(4, sys.byteorder)))
+    return best[1] if best else None
+
+
+_IP_ROUTE_GATEWAY = re.compile(rb"^default\s.*?\bvia\s+(\S+)", re.MULTILINE)
+"""Gateway of the first default route in raw ``ip route`` output."""
+
+
+def _gateway_from_ip_route() -> str | None:
     try:
         result = subprocess.run(
             ["ip", "route", "show", "default"],
             capture_output=True,
-            text=True,
             timeout=2,
             check=False,
         )
-        for line in result.stdout.splitlines():
-            parts = line.split()
-            if parts and parts[0] == "default":
-                idx = parts.index("via") + 1 if "via" in parts else None
-                if idx is not None:
-                    return parts[idx]
-    except (subprocess.TimeoutExpired, FileNotFoundError, ValueError):
-        pass
-    return None
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    match = _IP_ROUTE_GATEWAY.search(result.stdout)
+    return match[1].decode() if match else None
 
 
+@lru_cache(maxsize=1)
 def is_wsl2() -> bool:
     """Return True if running inside WSL2."""
     try:
-        kernel = Path("/proc/version").read_text()
-        return "microsoft" in kernel.lower() or "wsl" in kernel.lower()
+        kernel = Path("/proc/version").read_bytes().lower()
     except OSError:
         return False
+    return b"microsoft" in kernel or b"wsl" in kernel
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
 import struct
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from gamux.config import RumbleConfig
 from gamux.paths import rumble_fifo
@@ -20,57 +24,115 @@ DEFAULT_PATTERNS: dict[str, list[tuple[int, int]]] = {
     "error": [(0x8000, 500)],
 }
 
+_PACK = struct.Struct(">HH").pack
+_STOP_PAYLOAD = _PACK(0, 0)
+"""Wire command that stops the rumble motor."""
+_QUEUE_SIZE = 16
+"""Patterns waiting to play; further play() calls are dropped until one finishes."""
+
 
 class RumbleManager:
     """Sends rumble commands via FIFO to the bridge service.
 
     Patterns are loaded from config (RumbleConfig.patterns).
-    Falls back to DEFAULT_PATTERNS for missing entries.
+    Falls back to DEFAULT_PATTERNS for missing entries. Playback runs on one
+    worker task, so play() only queues the pattern and never waits out its holds.
     """
 
     def __init__(self, config: RumbleConfig) -> None:
         self._config = config
         self._fifo: Path = rumble_fifo()
-        self._patterns: dict[str, list[tuple[int, int]]] = {
-            **DEFAULT_PATTERNS,
-            **config.patterns,
-        }
-        self._lock = asyncio.Lock()
+        patterns: dict[str, list[tuple[int, int]]] = {**DEFAULT_PATTERNS, **config.patterns}
+        self._payloads: Mapping[str, tuple[tuple[bytes, float], ...]] = MappingProxyType(
+            {name: _compile(steps) for name, steps in patterns.items()}
+        )
+        """Read-only: pattern -> (wire commands, seconds to hold them), stop included."""
+        self._fd: int | None = None
+        """FIFO write end, opened on first send and kept until an error or stop()."""
+        self._queue: asyncio.Queue[tuple[tuple[bytes, float], ...]] = asyncio.Queue(_QUEUE_SIZE)
+        self._worker: asyncio.Task[None] | None = None
 
     async def play(self, pattern_name: str) -> None:
-        """Play a named rumble pattern."""
+        """Queue a named rumble pattern and return without waiting for it to play.
+
+        Patterns play in order; when the queue is full the new one is dropped.
+        """
         if not self._config.enabled:
             return
 
-        pattern = self._patterns.get(pattern_name)
-        if pattern is None:
+        steps = self._payloads.get(pattern_name)
+        if steps is None:
             logger.warning("Unknown rumble pattern: %r", pattern_name)
             return
 
-        async with self._lock:
-            for magnitude, duration_ms in pattern:
-                await self._send(magnitude, duration_ms)
-                if duration_ms > 0:
-                    await asyncio.sleep(duration_ms / 1000)
-            # stop rumble
-            await self._send(0, 0)
+        try:
+            self._queue.put_nowait(steps)
+        except asyncio.QueueFull:
+            logger.debug("Rumble queue full, dropping pattern %r.", pattern_name)
+            return
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._play_queued(), name="rumble")
 
     async def stop(self) -> None:
-        """Stop any ongoing rumble."""
-        await self._send(0, 0)
+        """Stop any ongoing rumble, discard queued patterns and release the FIFO."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+        self._send(_STOP_PAYLOAD)
+        self._close()
+
+    async def _play_queued(self) -> None:
+        while True:
+            steps = await self._queue.get()
+            try:
+                for payload, seconds in steps:
+                    self._send(payload)
+                    if seconds > 0:
+                        await asyncio.sleep(seconds)
+            finally:
+                self._queue.task_done()
+
+    def _send(self, payload: bytes) -> None:
+        """Write a rumble command to the FIFO.
+
+        The FIFO is non-blocking: with no bridge reading it the open fails, and a
+        full pipe drops the command, so this never stalls the event loop.
+        """
+        try:
+            if self._fd is None:
+                self._fd = os.open(self._fifo, os.O_WRONLY | os.O_NONBLOCK)
+            os.write(self._fd, payload)
+        except BlockingIOError:
+            logger.debug("Rumble FIFO full, dropping command.")
+        except OSError as e:
+            # Missing FIFO, no reader, or the reader went away (EPIPE): reopen next time.
+            self._close()
+            logger.debug("Rumble FIFO write failed: %s", e)
 
-    async def _send(self, magnitude: int, duration_ms: int) -> None:
-        """Write a rumble command to the FIFO."""
-        if not self._fifo.exists():
-            return
+    def _close(self) -> None:
+        if self._fd is not None:
+            with contextlib.suppress(OSError):
+                os.close(self._fd)
+            self._fd = None
 
-        payload = struct.pack(">HH", magnitude & 0xFFFF, duration_ms & 0xFFFF)
 
-        def _write_payload() -> None:
-            with self._fifo.open("wb") as fd:
-                fd.write(payload)
+def _compile(steps: list[tuple[int, int]]) -> tuple[tuple[bytes, float], ...]:
+    """Pack a pattern plus its trailing stop into writes separated by holds.
 
-        try:
-            await asyncio.to_thread(_write_payload)
-        except OSError as e:
-            logger.debug("Rumble FIFO write failed: %s", e)
+    Frames with no hold between them are joined into one write; timing is
+    unchanged because they were sent back to back anyway.
+    """
+    writes: list[tuple[bytes, float]] = []
+    pending = b""
+    for magnitude, duration_ms in steps:
+        pending += _PACK(magnitude & 0xFFFF, duration_ms & 0xFFFF)
+        if duration_ms > 0:
+            writes.append((pending, duration_ms / 1000))
+            pending = b""
+    writes.append((pending + _STOP_PAYLOAD, 0.0))
+    return tuple(writes)
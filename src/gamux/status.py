@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 
 import gamux.tmux as tmux
 
@@ -18,6 +19,15 @@ class StatusManager:
         self._session = session
         self._window = window
         self._current = ""
+        if window:
+            target = f"{session}:{window}" if session else window
+        else:
+            # Gamux's own pane names its window. Untargeted commands would act
+            # on whatever window the control-mode client has current.
+            target = os.environ.get("TMUX_PANE", "")
+        self._target_args: tuple[str, ...] = ("-t", target) if target else ()
+        self._automatic_rename: tuple[tuple[str, ...], bool] | None = None
+        """(target args, automatic-rename value) last sent (None = not yet set)."""
 
     async def set(self, message: str) -> None:
         """Set the status message."""
@@ -33,22 +43,23 @@ class StatusManager:
         await self._update("")
 
     async def _update(self, text: str) -> None:
+        # Without a target, spawn tmux so the command acts on the caller's client.
+        via_control = bool(self._target_args)
         try:
-            target = self._window or ""
-            if self._session and self._window:
-                target = f"{self._session}:{self._window}"
-
-            args = ["set-window-option"]
-            if target:
-                args += ["-t", target]
-            args += ["automatic-rename", "off" if text else "on"]
-            await tmux.run(*args)
+            setting = (self._target_args, not text)
+            if setting != self._automatic_rename:
+                await tmux.run_no_output(
+                    "set-window-option",
+                    *self._target_args,
+                    "automatic-rename",
+                    "off" if text else "on",
+                    control=via_control,
+                )
+                self._automatic_rename = setting
 
             if text:
-                rename_args = ["rename-window"]
-                if target:
-                    rename_args += ["-t", target]
-                rename_args.append(text)
-                await tmux.run(*rename_args)
+                await tmux.run_no_output(
+                    "rename-window", *self._target_args, text, control=via_control
+                )
         except Exception as e:  # pragma: no cover - tmux availability is environment dependent
             logger.debug("Status update failed: %s", e)
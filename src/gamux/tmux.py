@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+from collections import deque
+from collections.abc import Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +17,7 @@ class TmuxError(Exception):
     """Raised when a tmux command fails."""
 
 
-class TmuxTimeoutError(TmuxError):
+class TmuxTimeoutError(TmuxError, TimeoutError):
     """Raised when a tmux command times out."""
 
 
@@ -25,14 +28,57 @@ async def run(
 ) -> tuple[int, str, str]:
     """Run a tmux command.
 
+    Uses the shared control-mode connection (see `control()`) when it is
+    attached, otherwise spawns a tmux process. Commands there run as gamux's
+    control client, so anything that depends on the user's current client
+    must target it explicitly (``-t``) or use `current_pane()`.
+
     Returns (returncode, stdout, stderr).
     Raises TmuxTimeoutError if the command exceeds `timeout` seconds.
     Raises TmuxError if check=True and returncode != 0.
     """
+    if _control.supports(args):
+        rc, stdout, stderr = await _control.run(*args, timeout=timeout)
+    else:
+        rc, stdout, stderr = await _run_subprocess(args, timeout)
+
+    if check and rc != 0:
+        raise TmuxError(f"tmux {args[0]!r} failed (rc={rc}): {stderr.strip()}")
+
+    return rc, stdout, stderr
+
+
+async def run_no_output(
+    *args: str,
+    timeout: float = DEFAULT_TIMEOUT,
+    check: bool = False,
+    control: bool = True,
+) -> int:
+    """Run a tmux command whose stdout is not needed. Returns the return code.
+
+    A spawned tmux gets stdout on /dev/null, so only stderr is drained.
+    ``control=False`` always spawns, for commands with no ``-t`` that must act
+    on the caller's own client rather than gamux's control client.
+    Raises like `run()`.
+    """
+    if control and _control.supports(args):
+        rc, _, stderr = await _control.run(*args, timeout=timeout)
+    else:
+        rc, _, stderr = await _run_subprocess(args, timeout, capture_stdout=False)
+
+    if check and rc != 0:
+        raise TmuxError(f"tmux {args[0]!r} failed (rc={rc}): {stderr.strip()}")
+
+    return rc
+
+
+async def _run_subprocess(
+    args: Sequence[str], timeout: float, capture_stdout: bool = True
+) -> tuple[int, str, str]:
     proc = await asyncio.create_subprocess_exec(
         "tmux",
         *args,
-        stdout=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
         stderr=asyncio.subprocess.PIPE,
     )
     try:
@@ -42,40 +88,173 @@ async def run(
         await proc.communicate()
         raise TmuxTimeoutError(f"tmux {args[0]!r} timed out after {timeout}s") from exc
 
-    rc = proc.returncode or 0
-    stdout = stdout_b.decode()
-    stderr = stderr_b.decode()
-
-    if check and rc != 0:
-        raise TmuxError(f"tmux {args[0]!r} failed (rc={rc}): {stderr.strip()}")
-
-    return rc, stdout, stderr
+    return proc.returncode or 0, stdout_b.decode() if stdout_b else "", stderr_b.decode()
 
 
 async def send_keys(target: str, keys: str, timeout: float = DEFAULT_TIMEOUT) -> None:
     """Send keys to a tmux pane."""
-    await run("send-keys", "-t", target, keys, "", timeout=timeout, check=True)
+    await run_no_output("send-keys", "-t", target, keys, "", timeout=timeout, check=True)
 
 
 async def current_pane(timeout: float = DEFAULT_TIMEOUT) -> str:
     """Return the current tmux pane ID."""
-    _, stdout, _ = await run(
-        "display-message",
-        "-p",
-        "#{pane_id}",
-        timeout=timeout,
-        check=True,
-    )
-    return stdout.strip()
+    return await _display_user_client("#{pane_id}", timeout)
 
 
 async def current_session(timeout: float = DEFAULT_TIMEOUT) -> str:
     """Return the current tmux session name."""
-    _, stdout, _ = await run(
-        "display-message",
-        "-p",
-        "#{session_name}",
-        timeout=timeout,
-        check=True,
-    )
+    return await _display_user_client("#{session_name}", timeout)
+
+
+async def _display_user_client(fmt: str, timeout: float) -> str:
+    """Expand *fmt* for the user's tmux client, always in a spawned tmux.
+
+    Never sent over the control connection: there the command runs as
+    gamux's own control client, which stays on the session it attached to
+    and would miss the user switching sessions.
+    """
+    args = ("display-message", "-p", fmt)
+    rc, stdout, stderr = await _run_subprocess(args, timeout)
+    if rc != 0:
+        raise TmuxError(f"tmux {args[0]!r} failed (rc={rc}): {stderr.strip()}")
     return stdout.strip()
+
+
+def _quote(arg: str) -> str:
+    """Quote one argument for the tmux command parser."""
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+class TmuxControl:
+    """Persistent tmux control-mode (``tmux -C``) connection.
+
+    Each command is one line written to a long-lived tmux client and answered
+    by a ``%begin`` ... ``%end`` (or ``%error``) block, so a call costs a pipe
+    round-trip instead of a fork+exec. tmux answers commands in order, so
+    replies are matched to callers first-in, first-out. Notifications outside
+    a block are ignored.
+    """
+
+    def __init__(self) -> None:
+        self._proc: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task[None] | None = None
+        self._pending: deque[asyncio.Future[tuple[int, str, str]]] = deque()
+
+    @property
+    def connected(self) -> bool:
+        """True while the control client is attached."""
+        return self._reader is not None and not self._reader.done()
+
+    def supports(self, args: Sequence[str]) -> bool:
+        """Return True if `args` can be sent over the control connection.
+
+        Newlines end a command line in control mode, so such arguments need the
+        subprocess path.
+        """
+        return self.connected and not any("\n" in arg or "\r" in arg for arg in args)
+
+    async def start(self, session: str = "", timeout: float = DEFAULT_TIMEOUT) -> None:
+        """Attach a control client to `session` (or the most recent one)."""
+        args = ["-C", "attach-session", "-f", "no-output,ignore-size"]
+        if session:
+            args += ["-t", session]
+        self._proc = await asyncio.create_subprocess_exec(
+            "tmux",
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        # The attach command itself is answered with the first block.
+        attached = self._expect_reply()
+        self._reader = asyncio.create_task(self._read_loop(), name="tmux-control")
+        try:
+            rc, _, stderr = await asyncio.wait_for(attached, timeout=timeout)
+        except TimeoutError as exc:
+            await self.stop()
+            raise TmuxTimeoutError(f"tmux control mode attach timed out after {timeout}s") from exc
+        except TmuxError:
+            await self.stop()
+            raise
+        if rc != 0:
+            await self.stop()
+            raise TmuxError(f"tmux control mode attach failed: {stderr.strip()}")
+        logger.debug("tmux control mode attached (session=%s)", session or "default")
+
+    async def stop(self) -> None:
+        """Detach the control client."""
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            if proc.stdin is not None:
+                proc.stdin.close()
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=1.0)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+
+    async def run(self, *args: str, timeout: float = DEFAULT_TIMEOUT) -> tuple[int, str, str]:
+        """Run a tmux command over the control connection.
+
+        Returns (returncode, stdout, stderr) like `run`; returncode is 1 when
+        tmux answers with ``%error``.
+        """
+        if self._proc is None or self._proc.stdin is None or not self.connected:
+            raise TmuxError("tmux control mode is not connected")
+        reply = self._expect_reply()
+        self._proc.stdin.write(" ".join(_quote(arg) for arg in args).encode() + b"\n")
+        try:
+            return await asyncio.wait_for(reply, timeout=timeout)
+        except TimeoutError as exc:
+            raise TmuxTimeoutError(f"tmux {args[0]!r} timed out after {timeout}s") from exc
+
+    def _expect_reply(self) -> asyncio.Future[tuple[int, str, str]]:
+        future: asyncio.Future[tuple[int, str, str]] = asyncio.get_running_loop().create_future()
+        self._pending.append(future)
+        return future
+
+    async def _read_loop(self) -> None:
+        assert self._proc is not None and self._proc.stdout is not None
+        stdout = self._proc.stdout
+        guard: str | None = None  # "<time> <number> <flags>" of the open block
+        lines: list[str] = []
+        try:
+            while raw := await stdout.readline():
+                line = raw.decode(errors="replace").rstrip("\r\n")
+                if guard is None:
+                    if line.startswith("%begin "):
+                        guard = line[len("%begin ") :]
+                        lines = []
+                    continue
+                if line in (f"%end {guard}", f"%error {guard}"):
+                    text = "".join(f"{item}\n" for item in lines)
+                    result = (0, text, "") if line.startswith("%end") else (1, "", text)
+                    guard = None
+                    if self._pending:
+                        future = self._pending.popleft()
+                        if not future.done():
+                            future.set_result(result)
+                else:
+                    lines.append(line)
+        finally:
+            while self._pending:
+                future = self._pending.popleft()
+                if not future.done():
+                    future.set_exception(TmuxError("tmux control mode connection closed"))
+
+
+_control = TmuxControl()
+
+
+def control() -> TmuxControl:
+    """Return the process-wide control-mode connection used by `run()`.
+
+    It starts detached; `run()` spawns tmux per command until someone
+    calls ``await control().start(session)``.
+    """
+    return _control
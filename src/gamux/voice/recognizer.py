@@ -4,12 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Awaitable, Callable
+import threading
+from collections.abc import Awaitable, Callable, Iterable
 from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any
 
 import numpy as np
 
 from gamux.config import VoiceConfig
+from gamux.voice.source import PCM16_SCALE
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,8 @@ class VoiceRecognizer:
         self._config = config
         self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="whisper")
         self._model: object | None = None
+        self._transcribe_fn: Callable[[np.ndarray], tuple[Iterable[Any], Any]] | None = None
+        """model.transcribe with the fixed decoding options bound, set by load_model()."""
         self._pending_tasks: set[asyncio.Task[None]] = set()
         self._on_transcript: TranscriptCallback | None = None
 
@@ -40,15 +46,16 @@ class VoiceRecognizer:
         logger.info("Loading Whisper model: %s (%s)", self._config.model, self._config.compute_type)
         loop = asyncio.get_running_loop()
         self._model = await loop.run_in_executor(self._executor, self._load_model_sync)
+        self._transcribe_fn = partial(
+            self._model.transcribe,  # type: ignore[attr-defined]
+            language=self._config.language,
+            beam_size=self._config.beam_size,
+            vad_filter=False,  # VAD handled externally
+        )
         logger.info("Whisper model loaded.")
 
     def _load_model_sync(self) -> object:
-        from faster_whisper import WhisperModel
-
-        return WhisperModel(
-            self._config.model,
-            compute_type=self._config.compute_type,
-        )
+        return _get_model(self._config.model, self._config.compute_type)
 
     async def transcribe(self, audio: np.ndarray) -> None:
         """Submit audio for transcription. Non-blocking - result delivered via callback."""
@@ -56,7 +63,7 @@ class VoiceRecognizer:
             logger.warning("Transcribe called before model is loaded.")
             return
 
-        task = asyncio.create_task(self._transcribe_task(audio))
+        task = asyncio.create_task(self._transcribe_task(_as_float32(audio)))
         self._pending_tasks.add(task)
         task.add_done_callback(self._pending_tasks.discard)
 
@@ -74,12 +81,7 @@ class VoiceRecognizer:
             logger.exception("Transcription error")
 
     def _transcribe_sync(self, audio: np.ndarray) -> str:
-        segments, _ = self._model.transcribe(  # type: ignore[union-attr]
-            audio,
-            language=self._config.language,
-            beam_size=self._config.beam_size,
-            vad_filter=False,  # VAD handled externally
-        )
+        segments, _ = self._transcribe_fn(audio)  # type: ignore[misc]
         return " ".join(seg.text.strip() for seg in segments).strip()
 
     async def shutdown(self) -> None:
@@ -90,3 +92,39 @@ class VoiceRecognizer:
         self._pending_tasks.clear()
         self._executor.shutdown(wait=False)
         logger.info("VoiceRecognizer shut down.")
+
+
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _get_model_unlocked(model: str, compute_type: str) -> object:
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(model, compute_type=compute_type)
+
+
+def _get_model(model: str, compute_type: str) -> object:
+    """Return the process-wide WhisperModel for *model* / *compute_type*.
+
+    Loading takes seconds and holds hundreds of MB, so recognizers (and
+    reloads) share one instance. The lock keeps two executors from both
+    loading the same model on a cache miss; transcribe() itself is
+    thread-safe.
+    """
+    with _model_lock:
+        return _get_model_unlocked(model, compute_type)
+
+
+def _as_float32(audio: np.ndarray) -> np.ndarray:
+    """Return *audio* as float32 samples, which is what Whisper consumes.
+
+    Both audio sources already deliver float32, which passes through
+    untouched; int16 PCM is scaled to [-1.0, 1.0) in a single ufunc pass.
+    """
+    if audio.dtype == np.float32:
+        return audio
+    if audio.dtype == np.int16:
+        scaled: np.ndarray = np.multiply(audio, PCM16_SCALE, dtype=np.float32)
+        return scaled
+    return audio.astype(np.float32)
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
 from contextlib import suppress
+from typing import Any
 
 import numpy as np
 
@@ -16,6 +19,20 @@ logger = logging.getLogger(__name__)
 SAMPLE_RATE = 16000
 CHUNK_DURATION_MS = 30
 CHUNK_SAMPLES = int(SAMPLE_RATE * CHUNK_DURATION_MS / 1000)  # 480
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+"""Scale from int16 PCM to float32 samples in [-1.0, 1.0)."""
+_WIRE_PCM16 = np.dtype("<i2")
+"""Bridge sample format: little-endian int16, whatever the host byte order."""
+_RING_SLOTS = 64
+"""LocalSource ring capacity in chunks (~1.9 s of audio)."""
+_BRIDGE_BACKLOG = 50
+"""Unread bridge messages kept; the oldest is discarded when another arrives."""
+_OPEN_TIMEOUT = 2.0
+"""Seconds BridgeSource waits for the bridge handshake before retrying."""
+_MAX_RECONNECT_DELAY = 30.0
+"""Upper bound for BridgeSource's exponential reconnect backoff (seconds)."""
+_MAX_BACKLOG_CHUNKS = 16
+"""Unread LocalSource chunks kept after a consumer stall (~0.5 s); older ones are skipped."""
 
 
 class AudioSource(ABC):
@@ -31,7 +48,11 @@ class AudioSource(ABC):
 
     @abstractmethod
     async def chunks(self) -> AsyncIterator[np.ndarray]:
-        """Yield audio chunks as float32 numpy arrays at SAMPLE_RATE."""
+        """Yield audio chunks as float32 numpy arrays at SAMPLE_RATE.
+
+        A chunk may be a view the source reuses once iteration moves on;
+        copy it to keep it (the VAD copies into its capture buffer).
+        """
         # mypy requires this: make it a generator
         yield np.zeros(CHUNK_SAMPLES, dtype=np.float32)  # pragma: no cover
 
@@ -43,37 +64,103 @@ class AudioSource(ABC):
         await self.stop()
 
 
-class LocalSource(AudioSource):
-    """Audio from local microphone via sounddevice."""
+class _BufferedSource(AudioSource):
+    """An AudioSource whose producer buffers audio and signals :attr:`_ready`.
+
+    Subclasses implement :meth:`_drain` to yield whatever is buffered right
+    now; :meth:`chunks` drains, then sleeps until the producer signals again,
+    and ends after :meth:`_close` once the remaining audio is consumed.
+    """
+
+    def __init__(self) -> None:
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    async def chunks(self) -> AsyncIterator[np.ndarray]:
+        while True:
+            # Clear before draining: audio buffered after this point sets it again.
+            self._ready.clear()
+            for chunk in self._drain():
+                yield chunk
+            if self._closed:
+                break
+            await self._ready.wait()
+
+    @abstractmethod
+    def _drain(self) -> Iterator[np.ndarray]:
+        """Yield the chunks buffered so far, without blocking."""
+
+    def _close(self) -> None:
+        """End chunks() once the audio already buffered is consumed."""
+        self._closed = True
+        self._ready.set()
+
+
+class LocalSource(_BufferedSource):
+    """Audio from local microphone via sounddevice.
+
+    The PortAudio callback copies each block of int16 PCM into a preallocated
+    ring of slots and writes one byte to a pipe; the event loop watches the
+    pipe with ``add_reader``. There is one producer (the callback thread) and
+    one consumer (:meth:`chunks`), so the head/tail counters need no lock.
+    Chunks are scaled to float32 on the consumer side, into one reused buffer.
+    """
 
     def __init__(self, device: str | None = None, sample_rate: int = SAMPLE_RATE) -> None:
+        super().__init__()
         self._device = device if device and device != "auto" else None
         self._sample_rate = sample_rate
-        self._queue: asyncio.Queue[np.ndarray] = asyncio.Queue(maxsize=50)
+        self._ring = np.empty((_RING_SLOTS, CHUNK_SAMPLES), dtype=np.int16)
+        self._pcm = np.empty(CHUNK_SAMPLES, dtype=np.float32)
+        self._head = 0
+        """Chunks written; only the callback thread advances it."""
+        self._tail = 0
+        """Chunks consumed; only chunks() advances it."""
+        self._dropped = 0
+        """Newest blocks the callback dropped because the ring was full."""
+        self._skipped = 0
+        """Oldest chunks chunks() skipped to catch up; kept apart from _dropped (other thread)."""
+        self._wake_r = self._wake_w = -1
+        """Self-pipe the callback writes to so the event loop wakes up."""
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._stream: object | None = None
 
     async def start(self) -> None:
         import sounddevice as sd
 
-        loop = asyncio.get_running_loop()
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+        os.set_blocking(self._wake_w, False)
+        self._loop = asyncio.get_running_loop()
+        self._loop.add_reader(self._wake_r, self._on_wake)
+
+        # Byte views of each slot: the raw callback copies PCM in with a plain
+        # buffer assignment, creating no numpy objects on the PortAudio thread.
+        slot_bytes = [slot.data.cast("B") for slot in self._ring]
+        slots, wake_w = _RING_SLOTS, self._wake_w
 
         def _callback(
-            indata: np.ndarray,
+            indata: Any,  # cffi buffer of int16 frames
             frames: int,
             time: object,
             status: object,
         ) -> None:
-            del frames, time
+            del frames, time  # frames == CHUNK_SAMPLES (fixed blocksize)
             if status:
                 logger.warning("Audio status: %s", status)
-            chunk = indata[:, 0].copy().astype(np.float32)
-            with suppress(asyncio.QueueFull):
-                loop.call_soon_threadsafe(self._queue.put_nowait, chunk)
+            head = self._head
+            if head - self._tail >= slots:
+                self._dropped += 1  # consumer is a full ring behind; drop the newest block
+                return
+            slot_bytes[head % slots][:] = indata
+            self._head = head + 1  # publish only after the slot is written
+            with suppress(BlockingIOError):  # pipe full: a wakeup is already pending
+                os.write(wake_w, b"\0")
 
-        self._stream = sd.InputStream(
+        self._stream = sd.RawInputStream(
             samplerate=self._sample_rate,
             channels=1,
-            dtype="float32",
+            dtype="int16",
             blocksize=CHUNK_SAMPLES,
             device=self._device,
             callback=_callback,
@@ -86,26 +173,63 @@ class LocalSource(AudioSource):
             self._stream.stop()  # type: ignore[union-attr]
             self._stream.close()  # type: ignore[union-attr]
             self._stream = None
-        await self._queue.put(np.zeros(0, dtype=np.float32))  # sentinel
+        if self._dropped or self._skipped:
+            logger.warning(
+                "LocalSource fell behind: skipped %d stale and dropped %d new audio chunk(s).",
+                self._skipped,
+                self._dropped,
+            )
+            self._dropped = self._skipped = 0
+        self._close()
+        if self._loop is not None:
+            self._loop.remove_reader(self._wake_r)
+            self._loop = None
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = -1
 
-    async def chunks(self) -> AsyncIterator[np.ndarray]:
-        while True:
-            chunk = await self._queue.get()
-            if chunk.size == 0:
-                break
-            yield chunk
+    def _drain(self) -> Iterator[np.ndarray]:
+        ring, pcm, slots = self._ring, self._pcm, _RING_SLOTS
+        # Drop-oldest: after a stall, resume from recent audio rather than
+        # working through a stale backlog.
+        head = self._head
+        if head - self._tail > _MAX_BACKLOG_CHUNKS:
+            self._skipped += head - _MAX_BACKLOG_CHUNKS - self._tail
+            self._tail = head - _MAX_BACKLOG_CHUNKS
+        while self._tail < self._head:
+            np.multiply(ring[self._tail % slots], PCM16_SCALE, out=pcm)
+            self._tail += 1
+            # Valid until the next chunk, like BridgeSource's buffer.
+            yield pcm
 
+    def _on_wake(self) -> None:
+        with suppress(BlockingIOError):
+            os.read(self._wake_r, _RING_SLOTS)
+        self._ready.set()
 
-class BridgeSource(AudioSource):
+
+class BridgeSource(_BufferedSource):
     """Audio from Windows bridge service via WebSocket (WSL2 only)."""
 
-    def __init__(self, host: str = "", port: int = 8765, sample_rate: int = SAMPLE_RATE) -> None:
+    def __init__(
+        self,
+        host: str = "",
+        port: int = 8765,
+        sample_rate: int = SAMPLE_RATE,
+        reconnect_interval: float = 3.0,
+    ) -> None:
         from gamux.paths import wsl_gateway
 
+        super().__init__()
         self._host = host or wsl_gateway() or "127.0.0.1"
         self._port = port
         self._sample_rate = sample_rate
-        self._queue: asyncio.Queue[np.ndarray] = asyncio.Queue(maxsize=50)
+        self._reconnect_interval = reconnect_interval
+        """First retry delay after the connection drops; doubles up to _MAX_RECONNECT_DELAY."""
+        self._messages: deque[bytes] = deque(maxlen=_BRIDGE_BACKLOG)
+        """Raw int16 bridge messages, each one or more chunks long; full = drop oldest."""
+        self._pcm = np.empty(0, dtype=np.float32)
+        """Conversion buffer reused for every message; chunks are views into it."""
         self._ws: object | None = None
         self._task: asyncio.Task[None] | None = None
 
@@ -123,30 +247,52 @@ class BridgeSource(AudioSource):
             with suppress(asyncio.CancelledError):
                 await self._task
             self._task = None
-        await self._queue.put(np.zeros(0, dtype=np.float32))  # sentinel
+        self._close()
 
-    async def chunks(self) -> AsyncIterator[np.ndarray]:
-        while True:
-            chunk = await self._queue.get()
-            if chunk.size == 0:
-                break
-            yield chunk
+    def _drain(self) -> Iterator[np.ndarray]:
+        messages = self._messages
+        while messages:
+            message = messages.popleft()
+            n = len(message) // 2
+            if n > self._pcm.size:
+                self._pcm = np.empty(n, dtype=np.float32)
+            pcm = self._pcm[:n]
+            # One ufunc pass from the int16 bytes into the reused float32 buffer.
+            np.multiply(np.frombuffer(message, dtype=_WIRE_PCM16, count=n), PCM16_SCALE, out=pcm)
+            # The bridge may coalesce several chunks into one message.
+            for start in range(0, n, CHUNK_SAMPLES):
+                yield pcm[start : start + CHUNK_SAMPLES]
 
     async def _receive_loop(self) -> None:
         try:
             import websockets  # type: ignore[import-untyped]
 
-            async with websockets.connect(self.uri) as ws:
-                self._ws = ws
-                logger.info("BridgeSource connected.")
-                async for message in ws:
-                    if isinstance(message, bytes):
-                        pcm = np.frombuffer(message, dtype=np.int16).astype(np.float32) / 32768.0
-                        with suppress(asyncio.QueueFull):
-                            self._queue.put_nowait(pcm)
+            delay = self._reconnect_interval
+            while True:
+                try:
+                    await self._receive_from(websockets)
+                    delay = self._reconnect_interval  # it connected; restart the backoff
+                    logger.warning("BridgeSource disconnected; reconnecting in %.1fs", delay)
+                except Exception as e:  # connection refused, reset, closed abnormally...
+                    logger.warning("BridgeSource error: %s; reconnecting in %.1fs", e, delay)
+                self._ws = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, _MAX_RECONNECT_DELAY)
         except asyncio.CancelledError:
             pass
-        except Exception as e:  # pragma: no cover - network/runtime dependent
+        except Exception as e:  # pragma: no cover - websockets missing
             logger.error("BridgeSource error: %s", e)
         finally:
-            await self._queue.put(np.zeros(0, dtype=np.float32))
+            self._close()
+
+    async def _receive_from(self, websockets: Any) -> None:
+        """Stream one connection's messages into the backlog until it closes."""
+        # PCM doesn't compress; skip negotiating permessage-deflate.
+        async with websockets.connect(self.uri, compression=None, open_timeout=_OPEN_TIMEOUT) as ws:
+            self._ws = ws
+            logger.info("BridgeSource connected.")
+            async for message in ws:
+                if isinstance(message, bytes) and message:
+                    # Queued as received; chunks() converts when it is consumed.
+                    self._messages.append(message)
+                    self._ready.set()
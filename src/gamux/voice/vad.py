@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
@@ -11,6 +12,30 @@ import numpy as np
 logger = logging.getLogger(__name__)
 
 SAMPLE_RATE = 16000
+_NO_AUDIO = np.zeros(0, dtype=np.float32)
+
+
+def _sum_squares_numpy(chunk: np.ndarray) -> float:
+    # dot(chunk, chunk) is the sum of squares without a chunk**2 temporary.
+    return float(np.dot(chunk, chunk))
+
+
+try:
+    import numba  # type: ignore[import-not-found]
+except ImportError:  # optional JIT; the numpy dot product is the fallback
+    _sum_squares: Callable[[np.ndarray], float] = _sum_squares_numpy
+else:
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False)  # type: ignore[untyped-decorator]
+    def _sum_squares_jit(chunk: np.ndarray) -> float:
+        total = 0.0
+        for i in range(chunk.shape[0]):
+            total += chunk[i] * chunk[i]
+        return total
+
+    # Compile (or load from cache) now rather than on the first utterance.
+    _sum_squares_jit(np.zeros(480, dtype=np.float32))
+    _sum_squares = _sum_squares_jit
 
 
 class VADState(Enum):
@@ -19,14 +44,34 @@ class VADState(Enum):
     TRAILING = auto()
 
 
+_STATES = (VADState.SILENCE, VADState.SPEECH)
+"""VADState for each internal state index; process() dispatches on the index."""
+_SILENCE, _SPEECH = 0, 1
+
+
 @dataclass
 class VADConfig:
     threshold: float = 0.5
-    """RMS energy threshold for speech detection."""
+    """RMS energy floor for speech detection; nothing quieter ever counts as speech."""
+
+    mu: float = 0.4
+    """Speech RMS must also reach this fraction of the recent peak RMS (0 disables).
+
+    This drops audio much quieter than a recent loud peak, such as the fading
+    tail of an utterance or noise heard just after speech. It does not reject
+    steady noise above ``threshold``: held long enough, that noise becomes the
+    peak itself and passes the gate.
+    """
+
+    ema_alpha: float = 0.02
+    """Per-chunk decay rate of the recent peak energy tracker."""
 
     silence_duration_ms: int = 500
     """How long silence must persist before ending speech (ms)."""
 
+    max_utterance_ms: int = 30_000
+    """Capture buffer length; an utterance that fills it is ended there (ms)."""
+
     min_speech_ms: int = 100
     """Minimum speech duration to emit (ms)."""
 
@@ -39,8 +84,8 @@ class VADResult:
 
     speech_started: bool = False
     speech_ended: bool = False
-    audio_buffer: list[np.ndarray] = field(default_factory=list)
-    """Accumulated audio since speech started (only populated when speech_ended=True)."""
+    audio: np.ndarray = field(default_factory=lambda: _NO_AUDIO)
+    """Contiguous float32 audio since speech started (only populated when speech_ended=True)."""
 
 
 class VoiceActivityDetector:
@@ -52,53 +97,102 @@ class VoiceActivityDetector:
         for chunk in audio_chunks:
             result = vad.process(chunk)
             if result.speech_ended:
-                audio = np.concatenate(result.audio_buffer)
-                # send audio to recognizer
+                ...  # send result.audio to recognizer
     """
 
     def __init__(self, config: VADConfig | None = None) -> None:
         self._cfg = config or VADConfig()
-        self._state = VADState.SILENCE
-        self._buffer: list[np.ndarray] = []
+        self._state_i = _SILENCE
+        self._capture = np.empty(
+            self._cfg.sample_rate * self._cfg.max_utterance_ms // 1000, dtype=np.float32
+        )
+        """Preallocated utterance buffer; chunks are copied in as they arrive."""
+        self._capture_len = 0
         self._silence_samples = 0
         self._speech_samples = 0
+        self._peak_energy = 0.0
+        """Recent peak mean-square energy: jumps to louder chunks, decays to quieter ones."""
 
+        # Config-derived constants. Gating compares mean-square energy against
+        # squared thresholds, so no per-chunk sqrt is needed.
         silence_chunks = int(self._cfg.silence_duration_ms / 1000 * self._cfg.sample_rate / 480)
         self._silence_threshold_chunks = max(1, silence_chunks)
+        self._min_speech_samples = self._cfg.min_speech_ms * self._cfg.sample_rate // 1000
+        self._threshold_sq = self._cfg.threshold**2
+        self._mu_sq = self._cfg.mu**2
+        self._handlers: tuple[Callable[[np.ndarray, VADResult], None], ...] = (
+            self._on_silence,  # silence, quiet chunk
+            self._on_onset,  # silence, speech chunk
+            self._on_pause,  # speech, quiet chunk
+            self._on_speech,  # speech, speech chunk
+        )
+        """Transition per (state index, is_speech), indexed by state_i * 2 + is_speech."""
+
+    @property
+    def _state(self) -> VADState:
+        return _STATES[self._state_i]
 
     def reset(self) -> None:
         """Reset detector state."""
-        self._state = VADState.SILENCE
-        self._buffer.clear()
+        self._state_i = _SILENCE
+        self._capture_len = 0
         self._silence_samples = 0
         self._speech_samples = 0
 
     def process(self, chunk: np.ndarray) -> VADResult:
         """Process one audio chunk. Returns VADResult."""
         result = VADResult()
-        rms = float(np.sqrt(np.mean(chunk**2)))
-        is_speech = rms >= self._cfg.threshold
-
-        if self._state == VADState.SILENCE:
-            if is_speech:
-                self._state = VADState.SPEECH
-                self._buffer = [chunk]
-                self._speech_samples = len(chunk)
-                self._silence_samples = 0
-                result.speech_started = True
-
-        elif self._state == VADState.SPEECH:
-            self._buffer.append(chunk)
-            if is_speech:
-                self._speech_samples += len(chunk)
-                self._silence_samples = 0
-            else:
-                self._silence_samples += 1
-                if self._silence_samples >= self._silence_threshold_chunks:
-                    min_samples = int(self._cfg.min_speech_ms / 1000 * self._cfg.sample_rate)
-                    if self._speech_samples >= min_samples:
-                        result.speech_ended = True
-                        result.audio_buffer = list(self._buffer)
-                    self.reset()
-
+        energy = _sum_squares(chunk) / chunk.size if chunk.size else 0.0
+        alpha = self._cfg.ema_alpha
+        self._peak_energy = max(energy, (1.0 - alpha) * self._peak_energy + alpha * energy)
+        # Relative gate (rms >= mu * recent peak rms, squared): drops chunks much
+        # quieter than a recent loud peak. Constant noise pulls the peak down to
+        # its own level, so noise above the fixed floor still passes.
+        is_speech = energy >= self._threshold_sq and energy >= self._mu_sq * self._peak_energy
+        self._handlers[self._state_i * 2 + is_speech](chunk, result)
         return result
+
+    def _on_silence(self, chunk: np.ndarray, result: VADResult) -> None:
+        pass
+
+    def _on_onset(self, chunk: np.ndarray, result: VADResult) -> None:
+        self._state_i = _SPEECH
+        self._capture_len = 0
+        self._append(chunk)
+        self._speech_samples = len(chunk)
+        self._silence_samples = 0
+        result.speech_started = True
+
+    def _on_speech(self, chunk: np.ndarray, result: VADResult) -> None:
+        if not self._append(chunk):
+            self._end_utterance(result)  # capture buffer full
+            return
+        self._speech_samples += len(chunk)
+        self._silence_samples = 0
+
+    def _on_pause(self, chunk: np.ndarray, result: VADResult) -> None:
+        if not self._append(chunk):
+            self._end_utterance(result)  # capture buffer full
+            return
+        self._silence_samples += 1
+        if self._silence_samples >= self._silence_threshold_chunks:
+            self._end_utterance(result)
+
+    def _append(self, chunk: np.ndarray) -> bool:
+        """Copy *chunk* into the capture buffer; False if it doesn't fit."""
+        start = self._capture_len
+        end = start + len(chunk)
+        if end > len(self._capture):
+            return False
+        self._capture[start:end] = chunk
+        self._capture_len = end
+        return True
+
+    def _end_utterance(self, result: VADResult) -> None:
+        if self._speech_samples >= self._min_speech_samples:
+            result.speech_ended = True
+            # Hand the filled buffer over instead of copying it out; the next
+            # utterance gets a fresh one (np.empty only maps pages on write).
+            result.audio = self._capture[: self._capture_len]
+            self._capture = np.empty_like(self._capture)
+        self.reset()
@@ -50,6 +50,17 @@ async def test_action_context_run_tmux(action_ctx: ActionContext) -> None:
         )
 
 
+@pytest.mark.asyncio
+async def test_action_context_run_tmux_delegates_to_tmux_run(action_ctx: ActionContext) -> None:
+    """Test ActionContext.run_tmux goes through gamux.tmux.run with the configured timeout."""
+    with patch("gamux.tmux.run", new_callable=AsyncMock, return_value=(0, "out", "")) as mock_run:
+        assert await action_ctx.run_tmux("list-panes") == (0, "out", "")
+        mock_run.assert_awaited_once_with("list-panes", timeout=1.0)
+
+        await action_ctx.run_tmux("list-panes", timeout=0.2)
+        mock_run.assert_awaited_with("list-panes", timeout=0.2)
+
+
 @pytest.mark.asyncio
 async def test_action_context_send_keys(action_ctx: ActionContext) -> None:
     """Test ActionContext.send_keys calls run_tmux with correct arguments."""
@@ -125,6 +136,22 @@ async def test_action_registry_dispatch_by_string_unknown(action_ctx: ActionCont
     assert handled is False
 
 
+@pytest.mark.asyncio
+async def test_action_registry_caches_name_coercion(action_ctx: ActionContext) -> None:
+    """Test repeated misses reuse the cached ActionName coercion."""
+    from gamux.actions.registry import _name_of
+
+    _name_of.cache_clear()
+    registry = ActionRegistry()
+
+    for _ in range(3):
+        assert await registry.dispatch_by_string("invalid_action", action_ctx) is False
+        assert await registry.dispatch_by_string("paste", action_ctx) is False
+
+    info = _name_of.cache_info()
+    assert (info.misses, info.hits) == (2, 4)
+
+
 def test_action_registry_with_builtins() -> None:
     """Test ActionRegistry.with_builtins loads all handlers."""
     registry = ActionRegistry.with_builtins()
@@ -141,6 +168,7 @@ async def test_builtin_handlers_call_tmux(action_ctx: ActionContext) -> None:
         patch.object(ActionContext, "run_tmux", new_callable=AsyncMock) as mock_run_tmux,
         patch.object(ActionContext, "send_keys", new_callable=AsyncMock) as mock_send_keys,
     ):
+        mock_run_tmux.return_value = (0, "@1\n", "")
         for name, handler in BUILTIN_HANDLERS.items():
             mock_run_tmux.reset_mock()
             mock_send_keys.reset_mock()
@@ -149,3 +177,48 @@ async def test_builtin_handlers_call_tmux(action_ctx: ActionContext) -> None:
             # We don't need to assert exact calls for all, just that they were called if expected.
             if name not in [ActionName.PTT_START, ActionName.PTT_STOP]:
                 assert mock_run_tmux.called or mock_send_keys.called
+
+
+@pytest.mark.asyncio
+async def test_builtin_handlers_target_user_pane(action_ctx: ActionContext) -> None:
+    """Built-ins name the user's pane, since the control client has its own current session."""
+    from gamux.actions.builtin import BUILTIN_HANDLERS
+
+    with patch.object(ActionContext, "run_tmux", new_callable=AsyncMock) as mock_run_tmux:
+        mock_run_tmux.return_value = (0, "@1\n", "")
+        await BUILTIN_HANDLERS[ActionName.SWITCH_PANE](action_ctx)
+        assert mock_run_tmux.await_args_list[-1].args == ("select-pane", "-t", "@1.+")
+
+        for name in (ActionName.SWITCH_PANE_UP, ActionName.SWITCH_WINDOW_NEXT, ActionName.PASTE):
+            await BUILTIN_HANDLERS[name](action_ctx)
+            assert mock_run_tmux.await_args.args[1:3] == ("-t", "%0")
+
+        # Unknown pane: fall back to the untargeted commands.
+        ctx = ActionContext(config=action_ctx.config)
+        await BUILTIN_HANDLERS[ActionName.SWITCH_PANE](ctx)
+        mock_run_tmux.assert_awaited_with("select-pane", "-t", ":.+")
+        await BUILTIN_HANDLERS[ActionName.SWITCH_WINDOW_NEXT](ctx)
+        mock_run_tmux.assert_awaited_with("next-window")
+
+
+@pytest.mark.asyncio
+async def test_action_registry_dispatch_by_string_handler_error(
+    action_ctx: ActionContext,
+) -> None:
+    """Test ActionRegistry.dispatch_by_string reports a failing handler as unhandled."""
+    registry = ActionRegistry()
+    registry.register_all({ActionName.PASTE: AsyncMock(side_effect=RuntimeError("boom"))})
+
+    handled = await registry.dispatch_by_string("paste", action_ctx)
+
+    assert handled is False
+
+
+@pytest.mark.asyncio
+async def test_action_registry_dispatch_by_string_unregistered(action_ctx: ActionContext) -> None:
+    """Test ActionRegistry.dispatch_by_string with a valid but unregistered action."""
+    registry = ActionRegistry()
+
+    handled = await registry.dispatch_by_string("paste", action_ctx)
+
+    assert handled is False
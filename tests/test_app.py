@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+import gamux.tmux as tmux
 from gamux.app import App
 from gamux.config import AppConfig
 from gamux.controller.buttons import ButtonName
@@ -14,7 +15,7 @@ from gamux.controller.reader import ButtonEvent
 
 @pytest.fixture
 def mock_config():
-    return AppConfig(bindings={"A": "builtin:none", "ZL_A": "builtin:none"})
+    return AppConfig(bindings={"A": "send_enter", "ZL_A": "send_escape"})
 
 
 @pytest.fixture
@@ -25,9 +26,17 @@ def app(mock_config):
 
 @pytest.mark.asyncio
 async def test_app_setup(app):
-    with patch.object(app._status, "set", new_callable=AsyncMock) as mock_status_set:
+    with (
+        patch.object(app._status, "set", new_callable=AsyncMock) as mock_status_set,
+        patch("gamux.tmux.current_session", new_callable=AsyncMock, return_value="main"),
+        patch.object(app._tmux_control, "start", new_callable=AsyncMock) as mock_control_start,
+    ):
         await app.setup()
 
+        mock_control_start.assert_awaited_once_with(
+            "main", timeout=app._config.tmux.command_timeout
+        )
+
         # Check status updates
         mock_status_set.assert_any_call("loading model...")
         mock_status_set.assert_any_call("ready")
@@ -39,7 +48,7 @@ async def test_app_setup(app):
 @pytest.mark.asyncio
 async def test_app_on_button_normal(app):
     with (
-        patch.object(app._registry, "dispatch_by_string", new_callable=AsyncMock) as mock_dispatch,
+        patch.object(app._registry, "invoke", new_callable=AsyncMock) as mock_invoke,
         patch("gamux.tmux.current_pane", new_callable=AsyncMock, return_value="%1"),
         patch("gamux.tmux.current_session", new_callable=AsyncMock, return_value="sess"),
     ):
@@ -47,17 +56,18 @@ async def test_app_on_button_normal(app):
         event = ButtonEvent(button=ButtonName.A, pressed=True)
         await app._on_button(event)
 
-        # Should dispatch "builtin:none" (from bindings)
-        mock_dispatch.assert_called_once()
-        args, _ = mock_dispatch.call_args
-        assert args[0] == "builtin:none"
-        assert args[1].tmux_pane == "%1"
+        # Should invoke the handler bound to "A"
+        mock_invoke.assert_called_once()
+        args, _ = mock_invoke.call_args
+        assert args[0] == "send_enter"
+        assert args[1] is app._registry.resolve("send_enter")
+        assert args[2].tmux_pane == "%1"
 
 
 @pytest.mark.asyncio
 async def test_app_on_button_ptt(app):
     with (
-        patch.object(app._registry, "dispatch_by_string", new_callable=AsyncMock) as mock_dispatch,
+        patch.object(app._registry, "invoke", new_callable=AsyncMock) as mock_invoke,
         patch.object(app._status, "set", new_callable=AsyncMock) as mock_status,
     ):
         # Press ZL (PTT)
@@ -72,9 +82,9 @@ async def test_app_on_button_ptt(app):
         await app._on_button(event_a)
 
         # Should look up "ZL_A"
-        mock_dispatch.assert_called_once()
-        args, _ = mock_dispatch.call_args
-        assert args[0] == "builtin:none"
+        mock_invoke.assert_called_once()
+        args, _ = mock_invoke.call_args
+        assert args[0] == "send_escape"
 
         # Release ZL
         event_zl_up = ButtonEvent(button=ButtonName.ZL, pressed=False)
@@ -103,9 +113,11 @@ async def test_app_shutdown(app):
         patch.object(app._status, "clear", new_callable=AsyncMock) as mock_clear,
         patch.object(app._recognizer, "shutdown", new_callable=AsyncMock) as mock_rec_shutdown,
         patch.object(app._rumble, "stop", new_callable=AsyncMock) as mock_rumble_stop,
+        patch.object(app._tmux_control, "stop", new_callable=AsyncMock) as mock_control_stop,
     ):
         await app.shutdown()
         mock_set.assert_called_with("shutting down...")
+        mock_control_stop.assert_awaited_once()
         mock_rec_shutdown.assert_called_once()
         mock_rumble_stop.assert_called_once()
         mock_clear.assert_called_once()
@@ -119,9 +131,21 @@ async def test_app_on_button_misc(app):
 
     # Missing binding
     event_b = ButtonEvent(button=ButtonName.B, pressed=True)
-    with patch.object(app._registry, "dispatch_by_string", new_callable=AsyncMock) as mock_dispatch:
+    with patch.object(app._registry, "invoke", new_callable=AsyncMock) as mock_invoke:
         await app._on_button(event_b)
-        mock_dispatch.assert_not_called()
+        mock_invoke.assert_not_called()
+
+
+def test_app_compile_bindings_skips_invalid_entries(caplog):
+    config = AppConfig(
+        bindings={"ZL_dpad_up": "scroll_up", "ZL_nope": "paste", "B": "builtin:none"}
+    )
+    app = App(config)
+
+    assert list(app._bindings) == [(True, ButtonName.DPAD_UP)]
+    assert app._bindings[(True, ButtonName.DPAD_UP)][0] == "scroll_up"
+    assert "Unknown button in binding: 'ZL_nope'" in caplog.text
+    assert "Unknown action name in binding: 'builtin:none'" in caplog.text
 
 
 @pytest.mark.asyncio
@@ -155,7 +179,7 @@ async def test_app_audio_loop(app):
         app._ptt_active = True
         mock_result = MagicMock()
         mock_result.speech_ended = True
-        mock_result.audio_buffer = [np.zeros(480)]
+        mock_result.audio = np.zeros(480, dtype=np.float32)
         mock_vad.return_value = mock_result
 
         await app._audio_loop(source)
@@ -228,3 +252,58 @@ async def test_app_run(app):
 
         await app.run()
         mock_local_source.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_app_make_context_caches_tmux_probe(app):
+    with (
+        patch("gamux.tmux.current_pane", new_callable=AsyncMock, return_value="%1") as mock_pane,
+        patch("gamux.tmux.current_session", new_callable=AsyncMock, return_value="sess"),
+    ):
+        first = await app._make_context()
+        second = await app._make_context()
+
+        assert mock_pane.await_count == 1
+        assert second.tmux_pane == "%1"
+        assert second.tmux_session == "sess"
+        # Each event still gets its own context (handlers may write to extra).
+        assert second is not first
+
+        probed_at = app._ctx_cache[0]
+        with patch("gamux.app.time.monotonic", return_value=probed_at + 1.0):
+            await app._make_context()
+        assert mock_pane.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_app_focus_action_invalidates_context_cache():
+    app = App(AppConfig(bindings={"A": "switch_pane", "B": "send_enter"}))
+    with (
+        patch.object(app._registry, "invoke", new_callable=AsyncMock),
+        patch("gamux.tmux.current_pane", new_callable=AsyncMock, return_value="%1") as mock_pane,
+        patch("gamux.tmux.current_session", new_callable=AsyncMock, return_value="sess"),
+    ):
+        await app._on_button(ButtonEvent(button=ButtonName.B, pressed=True))
+        await app._on_button(ButtonEvent(button=ButtonName.B, pressed=True))
+        assert mock_pane.await_count == 1
+
+        await app._on_button(ButtonEvent(button=ButtonName.A, pressed=True))
+        assert app._ctx_cache is None
+        await app._on_button(ButtonEvent(button=ButtonName.B, pressed=True))
+        assert mock_pane.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_app_make_context_tolerates_failed_probe(app):
+    with (
+        patch("gamux.tmux.current_pane", new_callable=AsyncMock, return_value="%1"),
+        patch(
+            "gamux.tmux.current_session",
+            new_callable=AsyncMock,
+            side_effect=tmux.TmuxError("no server"),
+        ),
+    ):
+        ctx = await app._make_context()
+
+    assert ctx.tmux_pane == "%1"
+    assert ctx.tmux_session == ""
@@ -1,6 +1,6 @@
 import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from bridge.service import BridgeConfig, BridgeServer
@@ -13,6 +13,7 @@ def test_bridge_config_defaults() -> None:
     assert config.sample_rate == 16000
     assert config.channels == 1
     assert config.chunk_ms == 30
+    assert config.batch_chunks == 2
     assert config.device == ""
     assert config.reconnect_interval == 3.0
     assert config.log_level == "INFO"
@@ -29,6 +30,7 @@ port = 9000
 sample_rate = 44100
 channels = 2
 chunk_ms = 20
+batch_chunks = 4
 device = "Microphone"
 
 [service]
@@ -41,6 +43,7 @@ log_level = "DEBUG"
     assert config.sample_rate == 44100
     assert config.channels == 2
     assert config.chunk_ms == 20
+    assert config.batch_chunks == 4
     assert config.device == "Microphone"
     assert config.reconnect_interval == 5.0
     assert config.log_level == "DEBUG"
@@ -76,12 +79,14 @@ async def test_bridge_handle_client():
     # Wait a bit to ensure it's added
     await asyncio.sleep(0.05)
     assert mock_ws in server._clients
+    assert server._clients_snapshot == (mock_ws,)
 
     # Unblock and wait for task to finish
     stop_wait.set()
     await task
 
     assert mock_ws not in server._clients
+    assert server._clients_snapshot == ()
 
 
 @pytest.mark.asyncio
@@ -91,18 +96,170 @@ async def test_bridge_broadcast_loop():
     server._running = True
 
     mock_ws = AsyncMock()
-    server._clients.add(mock_ws)
+    mock_ws.transport = MagicMock()
+    mock_ws.transport.get_write_buffer_size.return_value = 0
+    server._add_client(mock_ws)
 
-    # Put chunk in queue
-    await server._audio_queue.put(b"audio data")
+    # Publish one message through the ring
+    index = server._ring.write_index()
+    server._ring.slots[index][:] = b"x" * len(server._ring.slots[index])
+    server._ring.commit()
+    server._audio_ready.set()
 
-    # Run loop for one iteration
-    broadcast_task = asyncio.create_task(server._broadcast_loop())
+    mock_websockets = MagicMock()
+    with patch.dict("sys.modules", {"websockets": mock_websockets}):
+        # Run loop for one iteration
+        broadcast_task = asyncio.create_task(server._broadcast_loop())
+        await asyncio.sleep(0.05)
 
-    await asyncio.sleep(0.05)
-    mock_ws.send.assert_called_with(b"audio data")
+    mock_websockets.broadcast.assert_called_once()
+    clients, message = mock_websockets.broadcast.call_args.args
+    assert list(clients) == [mock_ws]
+    assert bytes(message) == bytes(server._ring.slots[index])
 
     # Stop loop
     server._running = False
-    await server._audio_queue.put(b"stop")  # to unblock get()
     broadcast_task.cancel()
+
+
+def test_bridge_capture_callback_batches_into_ring() -> None:
+    import numpy as np
+
+    server = BridgeServer(BridgeConfig(batch_chunks=2))
+    mock_sd = MagicMock()
+    loop = MagicMock()
+
+    with patch.dict("sys.modules", {"sounddevice": mock_sd}):
+        server._capture_sync(loop)
+
+    assert mock_sd.RawInputStream.call_args.kwargs["dtype"] == "int16"
+    callback = mock_sd.RawInputStream.call_args.kwargs["callback"]
+    frames = server._config.chunk_frames
+    first = np.full(frames, 16383, dtype=np.int16).tobytes()
+    second = np.full(frames, -16383, dtype=np.int16).tobytes()
+
+    callback(first, frames, None, None)
+    assert list(server._ring.drain()) == []
+    callback(second, frames, None, None)
+    loop.call_soon_threadsafe.assert_called_once_with(server._audio_ready.set)
+
+    (message,) = server._ring.drain()
+    assert np.frombuffer(message, dtype=np.int16).tolist() == [16383] * frames + [-16383] * frames
+
+
+def test_bridge_capture_callback_keeps_first_channel() -> None:
+    import numpy as np
+
+    server = BridgeServer(BridgeConfig(channels=2, batch_chunks=1))
+    mock_sd = MagicMock()
+
+    with patch.dict("sys.modules", {"sounddevice": mock_sd}):
+        server._capture_sync(MagicMock())
+
+    callback = mock_sd.RawInputStream.call_args.kwargs["callback"]
+    frames = server._config.chunk_frames
+    stereo = np.empty((frames, 2), dtype=np.int16)
+    stereo[:, 0] = np.arange(frames)
+    stereo[:, 1] = -1
+    callback(stereo.tobytes(), frames, None, None)
+
+    (message,) = server._ring.drain()
+    assert np.frombuffer(message, dtype=np.int16).tolist() == list(range(frames))
+
+
+@pytest.mark.asyncio
+async def test_bridge_stop_releases_capture_thread() -> None:
+    server = BridgeServer(BridgeConfig())
+    server._running = True
+    server._stopped.clear()
+    mock_sd = MagicMock()
+
+    with patch.dict("sys.modules", {"sounddevice": mock_sd}):
+        capture = asyncio.create_task(server._capture_loop())
+        await asyncio.sleep(0.05)
+        assert not capture.done()
+
+        server.stop()
+        await asyncio.wait_for(capture, timeout=1.0)
+
+    mock_sd.RawInputStream.return_value.__exit__.assert_called_once()
+    assert server._audio_ready.is_set()
+
+
+def test_pcm_ring_refuses_writes_when_full() -> None:
+    from bridge.service import _PcmRing
+
+    ring = _PcmRing(n_slots=2, slot_bytes=1)
+    for value in (b"a", b"b"):
+        index = ring.write_index()
+        assert index is not None
+        ring.slots[index][:] = value
+        ring.commit()
+    assert ring.write_index() is None
+
+    messages = ring.drain()
+    assert bytes(next(messages)) == b"a"
+    # The slot being read is not released until the reader moves on.
+    assert ring.write_index() is None
+    assert bytes(next(messages)) == b"b"
+    assert ring.write_index() == 0
+
+
+def test_bridge_skips_and_aborts_stalled_clients() -> None:
+    from bridge.service import MAX_CONSECUTIVE_DROPS
+
+    server = BridgeServer(BridgeConfig())
+    fast = MagicMock()
+    fast.transport.get_write_buffer_size.return_value = 0
+    stalled = MagicMock()
+    stalled.transport.get_write_buffer_size.return_value = server._write_limit + 1
+    server._add_client(fast)
+    server._add_client(stalled)
+
+    for _ in range(MAX_CONSECUTIVE_DROPS):
+        assert server._ready_clients() == [fast]
+    stalled.transport.abort.assert_not_called()
+    assert server._clients[stalled] == MAX_CONSECUTIVE_DROPS
+
+    assert server._ready_clients() == [fast]
+    stalled.transport.abort.assert_called_once()
+
+    # A client that catches up is served again and its drop count resets.
+    stalled.transport.get_write_buffer_size.return_value = 0
+    assert server._ready_clients() is server._clients_snapshot
+    assert server._clients_snapshot == (fast, stalled)
+    assert server._clients[stalled] == 0
+
+
+def test_log_listener_moves_root_handlers_off_thread() -> None:
+    import logging.handlers
+    import threading
+
+    from bridge.service import _start_log_listener
+
+    emitted_on = []
+    records = []
+    handler = logging.Handler()
+
+    def emit(record: logging.LogRecord) -> None:
+        emitted_on.append(threading.current_thread())
+        records.append(record)
+
+    handler.emit = emit  # type: ignore[method-assign]
+
+    root = logging.getLogger()
+    saved = root.handlers
+    root.handlers = [handler]
+    try:
+        listener = _start_log_listener()
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        logging.getLogger("bridge.service").error("Audio status: %s", "overflow")
+        listener.stop()
+    finally:
+        root.handlers = saved
+
+    assert len(emitted_on) == 1
+    assert emitted_on[0] is not threading.current_thread()
+    # Formatting is left to the listener thread: the record arrives untouched.
+    assert records[0].msg == "Audio status: %s"
+    assert records[0].args == ("overflow",)
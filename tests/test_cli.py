@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
-from gamux.cli import app
+from gamux.cli import _loop_factory, app
 
 runner = CliRunner()
 
@@ -90,3 +90,11 @@ def test_cli_doctor_json():
         assert result.exit_code == 0
         data = json.loads(result.stdout)
         assert any(d["name"] == "evdev" and d["status"] == "ok" for d in data)
+
+
+def test_loop_factory_prefers_uvloop():
+    mock_uvloop = MagicMock()
+    with patch.dict("sys.modules", {"uvloop": mock_uvloop}):
+        assert _loop_factory() is mock_uvloop.new_event_loop
+    with patch.dict("sys.modules", {"uvloop": None}):
+        assert _loop_factory() is None
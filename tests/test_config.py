@@ -45,6 +45,58 @@ beam_size = 10
     assert config.bindings["ZL_A"] == "test_action"
 
 
+def test_app_config_load_converts_rumble_patterns(tmp_path: Path) -> None:
+    p = tmp_path / "config.toml"
+    p.write_text("""
+[voice]
+language = "en"
+
+[rumble]
+patterns = { ok = [[100, 50], [0, 20]] }
+
+[bindings]
+"ZL_A" = "confirm"
+""")
+    config = AppConfig.load(p)
+    assert config.rumble.patterns == {"ok": [(100, 50), (0, 20)]}
+    assert config.voice.beam_size == 5
+
+
+def test_app_config_load_validates_fields(tmp_path: Path) -> None:
+    p = tmp_path / "config.toml"
+    p.write_text('[voice]\nbeam_size = "5"\n')
+    assert AppConfig.load(p).voice.beam_size == 5  # coerced, not kept as a str
+
+    for bad in ("[voice]\nbeam_size = 0\n", "[voice]\nvad_threshold = 7.0\n"):
+        p.write_text(bad)
+        with pytest.raises(ValidationError):
+            AppConfig.load(p)
+        with pytest.raises(ValidationError):
+            AppConfig.load_with_override(p)
+
+    p.write_text('[bindings]\n"ZL_A" = " "\n')
+    with pytest.raises(ValidationError, match="empty action name"):
+        AppConfig.load(p)
+
+
+def test_app_config_load_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    from unittest.mock import patch
+
+    import gamux.config as config_mod
+
+    p = tmp_path / "config.toml"
+    p.write_text('[voice]\nlanguage = "en"\n')
+
+    with patch.object(config_mod, "_toml_loads", wraps=config_mod._toml_loads) as mock_load:
+        assert AppConfig.load(p).voice.language == "en"
+        assert AppConfig.load(p) is AppConfig.load(p)
+        assert mock_load.call_count == 1
+
+        p.write_text('[voice]\nlanguage = "fr"\n')
+        assert AppConfig.load(p).voice.language == "fr"
+        assert mock_load.call_count == 2
+
+
 def test_app_config_validation_error() -> None:
     with pytest.raises(ValidationError):
         # beam_size must be >= 1
@@ -57,11 +109,32 @@ def test_app_config_bindings_validation() -> None:
         AppConfig(bindings={"ZL_A": "  "})
 
 
+def test_app_config_binding_index() -> None:
+    from gamux.controller.buttons import ButtonName
+
+    config = AppConfig(bindings={"A": "confirm", "ZL_dpad_up": "scroll_up", "ZL_nope": "paste"})
+
+    assert config.binding_index == {
+        (False, ButtonName.A): "confirm",
+        (True, ButtonName.DPAD_UP): "scroll_up",
+    }
+    assert config.binding_index is config.binding_index
+
+
 def test_deep_merge() -> None:
     base = {"a": 1, "b": {"c": 2}}
     override = {"b": {"d": 3}, "e": 4}
     result = _deep_merge(base, override)
     assert result == {"a": 1, "b": {"c": 2, "d": 3}, "e": 4}
+    assert base == {"a": 1, "b": {"c": 2}}
+
+
+def test_deep_merge_nested_and_replaced_tables() -> None:
+    base = {"x": {"y": {"z": 1, "w": 2}}, "t": {"k": 1}, "s": 5}
+    override = {"x": {"y": {"z": 9}}, "t": {}, "s": {"now": "table"}}
+    result = _deep_merge(base, override)
+    assert result == {"x": {"y": {"z": 9, "w": 2}}, "t": {"k": 1}, "s": {"now": "table"}}
+    assert base["x"] == {"y": {"z": 1, "w": 2}}
 
 
 def test_app_config_load_with_override(tmp_path: Path) -> None:
@@ -1,4 +1,5 @@
 import asyncio
+import os
 from unittest.mock import MagicMock, patch
 
 import evdev
@@ -42,6 +43,26 @@ def test_normalization():
     assert reader._normalize(-40000, AnalogAxis.LEFT_X) == -1.0  # Clamped
 
 
+def test_normalization_uses_per_axis_neutral():
+    config = ControllerConfig(stick_deadzone=1.0, stick_neutral_x=100, stick_neutral_y=-100)
+    reader = ControllerReader(config)
+
+    assert reader._normalize(32867, AnalogAxis.RIGHT_X) == 1.0
+    assert reader._normalize(32667, AnalogAxis.RIGHT_X) == 0.0
+    assert reader._normalize(-32867, AnalogAxis.LEFT_Y) == -1.0
+
+
+@pytest.mark.parametrize("deadzone", [0.0, 0.15, 1.0])
+def test_normalization_table_matches_formula(deadzone):
+    config = ControllerConfig(stick_deadzone=deadzone, stick_neutral_x=-77, stick_neutral_y=300)
+    reader = ControllerReader(config)
+
+    for axis in (AnalogAxis.LEFT_X, AnalogAxis.RIGHT_Y):
+        for value in range(-32768, 32768, 37):
+            assert reader._normalize(value, axis) == reader._normalize_uncached(value, axis)
+    assert type(reader._normalize(12345, AnalogAxis.LEFT_X)) is float
+
+
 @pytest.mark.asyncio
 async def test_controller_reader_events():
     config = ControllerConfig(device_path="/dev/input/event0")
@@ -56,23 +77,18 @@ async def test_controller_reader_events():
             self.code = code
             self.value = value
 
-    async def mock_async_read_loop():
+    # One device.read() returns every pending event as a batch.
+    batch = [
         # EV_KEY: BTN_SOUTH (304) -> ButtonName.B
-        yield MockEv(evdev.ecodes.EV_KEY, 304, 1)  # Press B
-        yield MockEv(evdev.ecodes.EV_KEY, 304, 0)  # Release B
-
+        MockEv(evdev.ecodes.EV_KEY, 304, 1),  # Press B
+        MockEv(evdev.ecodes.EV_KEY, 304, 0),  # Release B
         # EV_ABS: ABS_X (0) -> AnalogAxis.LEFT_X
-        yield MockEv(evdev.ecodes.EV_ABS, 0, 32767)  # Move stick to max
-
+        MockEv(evdev.ecodes.EV_ABS, 0, 32767),  # Move stick to max
         # EV_ABS: ABS_HAT0X (16) -> D-pad Left/Right
-        yield MockEv(evdev.ecodes.EV_ABS, evdev.ecodes.ABS_HAT0X, -1)  # D-pad Left press
-        yield MockEv(evdev.ecodes.EV_ABS, evdev.ecodes.ABS_HAT0X, 0)  # D-pad Left release (center)
-
-        # Give some time for events to be processed before loop ends if needed,
-        # but here we just end the loop.
-        await asyncio.sleep(0.01)
-
-    mock_device.async_read_loop.return_value = mock_async_read_loop()
+        MockEv(evdev.ecodes.EV_ABS, evdev.ecodes.ABS_HAT0X, -1),  # D-pad Left press
+        MockEv(evdev.ecodes.EV_ABS, evdev.ecodes.ABS_HAT0X, 0),  # D-pad Left release (center)
+    ]
+    mock_device.read.return_value = iter(batch)
 
     with patch("evdev.InputDevice", return_value=mock_device):
         reader = ControllerReader(config)
@@ -99,9 +115,118 @@ async def test_controller_reader_events():
     assert events[4] == ButtonEvent(ButtonName.DPAD_LEFT, False)
 
 
+@pytest.mark.asyncio
+async def test_events_coalesce_stick_samples_within_a_batch():
+    mock_device = MagicMock()
+    batch = [
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_ABS, evdev.ecodes.ABS_X, 100),
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_KEY, evdev.ecodes.BTN_SOUTH, 1),
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_ABS, evdev.ecodes.ABS_X, 200),
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_ABS, evdev.ecodes.ABS_HAT0X, -1),
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_ABS, evdev.ecodes.ABS_Y, 50),
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_ABS, evdev.ecodes.ABS_HAT0X, 0),
+        evdev.InputEvent(0, 0, evdev.ecodes.EV_ABS, evdev.ecodes.ABS_X, 300),
+    ]
+    mock_device.read.side_effect = [iter(batch), OSError(19, "No such device")]
+
+    with patch("evdev.InputDevice", return_value=mock_device):
+        reader = ControllerReader(ControllerConfig(device_path="/dev/input/event0"))
+        await reader.start()
+        events = [event async for event in reader.events()]
+        await reader.stop()
+
+    assert [(type(e).__name__, e[0], e[1]) for e in events] == [
+        ("ButtonEvent", ButtonName.B, True),
+        ("ButtonEvent", ButtonName.DPAD_LEFT, True),
+        ("AnalogEvent", AnalogAxis.LEFT_Y, 50),
+        ("ButtonEvent", ButtonName.DPAD_LEFT, False),
+        ("AnalogEvent", AnalogAxis.LEFT_X, 300),
+    ]
+
+
+def test_map_abs_dpad_releases_previous_direction():
+    reader = ControllerReader(ControllerConfig())
+
+    class MockEv:
+        def __init__(self, code, value):
+            self.type = evdev.ecodes.EV_ABS
+            self.code = code
+            self.value = value
+
+    hat_x = evdev.ecodes.ABS_HAT0X
+    assert reader._map_abs(MockEv(hat_x, -1)) == (ButtonEvent(ButtonName.DPAD_LEFT, True),)
+    assert reader._map_abs(MockEv(hat_x, 1)) == (
+        ButtonEvent(ButtonName.DPAD_LEFT, False),
+        ButtonEvent(ButtonName.DPAD_RIGHT, True),
+    )
+    assert reader._map_abs(MockEv(hat_x, 0)) == (ButtonEvent(ButtonName.DPAD_RIGHT, False),)
+    assert reader._map_abs(MockEv(evdev.ecodes.ABS_MISC, 1)) == ()
+
+    # Out-of-range hat values release the held direction, like centring.
+    hat_y = evdev.ecodes.ABS_HAT0Y
+    reader._map_abs(MockEv(hat_y, 1))
+    assert reader._map_abs(MockEv(hat_y, 7)) == (ButtonEvent(ButtonName.DPAD_DOWN, False),)
+    assert reader._dpad_y is None
+
+
+@pytest.mark.asyncio
+async def test_events_ends_when_device_read_fails():
+    mock_device = MagicMock()
+    mock_device.read.side_effect = OSError(19, "No such device")
+
+    with patch("evdev.InputDevice", return_value=mock_device):
+        reader = ControllerReader(ControllerConfig(device_path="/dev/input/event0"))
+        await reader.start()
+        events = [event async for event in reader.events()]
+        await reader.stop()
+
+    assert events == []
+    mock_device.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_events_waits_for_readable_device_between_batches():
+    read_fd, write_fd = os.pipe()
+    mock_device = MagicMock()
+    mock_device.fd = read_fd
+    press = MagicMock(type=evdev.ecodes.EV_KEY, code=304, value=1)
+
+    def read():
+        # Like evdev: drain what is pending; BlockingIOError if nothing is.
+        os.read(read_fd, 64)
+        return iter([press])
+
+    os.set_blocking(read_fd, False)
+    mock_device.read.side_effect = read
+
+    try:
+        with patch("evdev.InputDevice", return_value=mock_device):
+            reader = ControllerReader(ControllerConfig(device_path="/dev/input/event0"))
+            await reader.start()
+            events = reader.events()
+
+            first = asyncio.ensure_future(anext(events))
+            await asyncio.sleep(0.01)
+            assert not first.done()  # parked on the fd, not spinning
+
+            os.write(write_fd, b"\0")  # the device becomes readable
+            assert await asyncio.wait_for(first, 1) == ButtonEvent(ButtonName.B, True)
+
+            # stop() wakes a reader that is waiting for the next batch.
+            second = asyncio.ensure_future(anext(events))
+            await asyncio.sleep(0.01)
+            await reader.stop()
+            with pytest.raises(StopAsyncIteration):
+                await asyncio.wait_for(second, 1)
+    finally:
+        os.close(read_fd)
+        os.close(write_fd)
+
+
 @pytest.mark.asyncio
 async def test_find_device():
     with (
+        patch.dict("sys.modules", {"pyudev": None}),
         patch("evdev.list_devices", return_value=["/dev/input/event0"]),
         patch("evdev.InputDevice") as mock_input_device,
     ):
@@ -115,3 +240,49 @@ async def test_find_device():
 
         device_path = reader._find_device()
         assert device_path == "/dev/input/event0"
+
+
+def test_find_device_prefers_udev_joysticks():
+    joystick_js = MagicMock(sys_name="js0", device_node="/dev/input/js0")
+    locked = MagicMock(sys_name="event5", device_node="/dev/input/event5")
+    flight_stick = MagicMock(sys_name="event6", device_node="/dev/input/event6")
+    gamepad = MagicMock(sys_name="event7", device_node="/dev/input/event7")
+    mock_pyudev = MagicMock()
+    mock_pyudev.Context.return_value.list_devices.return_value = [
+        joystick_js,
+        locked,
+        flight_stick,
+        gamepad,
+    ]
+    reader = ControllerReader(ControllerConfig(device_path=""))
+
+    def open_device(path):
+        if path == "/dev/input/event5":
+            raise PermissionError(13, "Permission denied")
+        dev = MagicMock()
+        buttons = [("BTN_TRIGGER", 288)] if path == "/dev/input/event6" else [("BTN_SOUTH", 304)]
+        dev.capabilities.return_value = {("EV_KEY", 1): buttons}
+        return dev
+
+    with (
+        patch.dict("sys.modules", {"pyudev": mock_pyudev}),
+        patch("evdev.InputDevice", side_effect=open_device) as mock_input_device,
+        patch("evdev.list_devices") as mock_list_devices,
+    ):
+        # Unreadable and non-gamepad joystick nodes are skipped, as in the scan.
+        assert reader._find_device() == "/dev/input/event7"
+        mock_pyudev.Context.return_value.list_devices.assert_called_once_with(
+            subsystem="input", ID_INPUT_JOYSTICK="1"
+        )
+        assert [c.args[0] for c in mock_input_device.call_args_list] == [
+            "/dev/input/event5",
+            "/dev/input/event6",
+            "/dev/input/event7",
+        ]
+        mock_list_devices.assert_not_called()
+
+        # No udev candidate qualifies (or udev knows none): probe every device instead.
+        mock_pyudev.Context.return_value.list_devices.return_value = [locked, flight_stick]
+        mock_list_devices.return_value = []
+        assert reader._find_device() is None
+        mock_list_devices.assert_called_once()
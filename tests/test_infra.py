@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import shutil
 import struct
+import subprocess
+import tempfile
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -70,52 +74,215 @@ async def test_tmux_run_timeout():
 
 @pytest.mark.asyncio
 async def test_tmux_helpers():
-    with patch("gamux.tmux.run") as mock_run:
+    with patch("gamux.tmux._run_subprocess") as mock_run:
         mock_run.return_value = (0, " %1 \n", "")
         pane = await tmux.current_pane()
         assert pane == "%1"
-        mock_run.assert_called_with("display-message", "-p", "#{pane_id}", timeout=5.0, check=True)
+        mock_run.assert_called_with(("display-message", "-p", "#{pane_id}"), 5.0)
 
         mock_run.return_value = (0, "my-session\n", "")
         session = await tmux.current_session()
         assert session == "my-session"
-        mock_run.assert_called_with(
-            "display-message", "-p", "#{session_name}", timeout=5.0, check=True
-        )
+        mock_run.assert_called_with(("display-message", "-p", "#{session_name}"), 5.0)
+
+        mock_run.return_value = (1, "", "no server running\n")
+        with pytest.raises(tmux.TmuxError, match="no server running"):
+            await tmux.current_session()
 
-        mock_run.return_value = (0, "", "")
+    with patch("gamux.tmux.run_no_output") as mock_run_no_output:
+        mock_run_no_output.return_value = 0
         await tmux.send_keys("%1", "hello")
-        mock_run.assert_called_with("send-keys", "-t", "%1", "hello", "", timeout=5.0, check=True)
+        mock_run_no_output.assert_called_with(
+            "send-keys", "-t", "%1", "hello", "", timeout=5.0, check=True
+        )
 
 
-# --- rumble tests ---
+@pytest.mark.asyncio
+async def test_tmux_run_no_output_discards_stdout():
+    with patch("asyncio.create_subprocess_exec") as mock_exec:
+        mock_proc = AsyncMock()
+        mock_proc.communicate.return_value = (None, b"can't find pane: %9\n")
+        mock_proc.returncode = 1
+        mock_exec.return_value = mock_proc
+
+        assert await tmux.run_no_output("send-keys", "-t", "%9", "x") == 1
+        assert mock_exec.call_args.kwargs["stdout"] == asyncio.subprocess.DEVNULL
+
+        with pytest.raises(tmux.TmuxError, match="can't find pane"):
+            await tmux.run_no_output("send-keys", "-t", "%9", "x", check=True)
 
 
 @pytest.mark.asyncio
-async def test_rumble_manager_play():
-    config = RumbleConfig(enabled=True, patterns={"test": [(0xFFFF, 50)]})
+async def test_tmux_run_uses_shared_control_connection():
+    control = tmux.control()
+    assert not control.connected
+    with (
+        patch.object(control, "supports", return_value=True),
+        patch.object(control, "run", new_callable=AsyncMock) as mock_control_run,
+        patch("gamux.tmux._run_subprocess", new_callable=AsyncMock) as mock_subprocess,
+    ):
+        mock_control_run.return_value = (0, "%3\n", "")
+        assert await tmux.run("list-panes", "-F", "#{pane_id}") == (0, "%3\n", "")
+        mock_control_run.assert_awaited_once_with("list-panes", "-F", "#{pane_id}", timeout=5.0)
+
+        mock_control_run.return_value = (1, "", "unknown command: bogus\n")
+        with pytest.raises(tmux.TmuxError, match="unknown command"):
+            await tmux.run("bogus", check=True)
+        mock_subprocess.assert_not_called()
+
+        # The user's current pane is never asked of gamux's own control client.
+        mock_subprocess.return_value = (0, "%5\n", "")
+        assert await tmux.current_pane() == "%5"
+        assert mock_control_run.await_count == 2
+
+
+@pytest.fixture
+def tmux_server(monkeypatch):
+    """An isolated tmux server with sessions s1 and s2; skipped without tmux."""
+    if shutil.which("tmux") is None:
+        pytest.skip("tmux not installed")
+    # Short directory: tmux socket paths are length-limited.
+    socket_dir = tempfile.mkdtemp(prefix="gamux-")
+    monkeypatch.setenv("TMUX_TMPDIR", socket_dir)
+    monkeypatch.delenv("TMUX", raising=False)
+    monkeypatch.delenv("TMUX_PANE", raising=False)
+    for session in ("s1", "s2"):
+        subprocess.run(["tmux", "new-session", "-d", "-s", session], check=True)
+    try:
+        yield
+    finally:
+        subprocess.run(["tmux", "kill-server"], check=False)
+        shutil.rmtree(socket_dir, ignore_errors=True)
 
-    with patch("gamux.rumble.rumble_fifo") as mock_fifo_path:
-        mock_path = MagicMock(spec=Path)
-        mock_path.exists.return_value = True
-        mock_fifo_path.return_value = mock_path
 
-        manager = RumbleManager(config)
+@pytest.mark.asyncio
+async def test_current_session_follows_user_client_switch(tmux_server):
+    control = tmux.TmuxControl()
+    user = tmux.TmuxControl()  # stands in for the user's terminal client
+    try:
+        await control.start("s1")
+        await user.start("s1")
+        await user.run("switch-client", "-t", "s2")
+
+        with patch.object(tmux, "_control", control):
+            assert control.supports(("display-message",))
+            assert await tmux.current_session() == "s2"
+        # gamux's own control client stayed where it attached.
+        assert await control.run("display-message", "-p", "#{session_name}") == (0, "s1\n", "")
+    finally:
+        await user.stop()
+        await control.stop()
+
+
+class _FakeControlProc:
+    """Stand-in for a ``tmux -C`` child: stdout is fed by the test."""
+
+    def __init__(self) -> None:
+        self.stdin = MagicMock()
+        self.stdout = asyncio.StreamReader()
+        self.returncode: int | None = None
+
+    async def wait(self) -> int:
+        return 0
+
+    def kill(self) -> None:
+        pass
 
-        with patch.object(mock_path, "open") as mock_open:
-            mock_file = MagicMock()
-            mock_open.return_value.__enter__.return_value = mock_file
 
-            await manager.play("test")
+@pytest.mark.asyncio
+async def test_tmux_control_mode():
+    proc = _FakeControlProc()
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as mock_exec:
+        control = tmux.TmuxControl()
+        proc.stdout.feed_data(b"%begin 1 1 0\n%end 1 1 0\n%session-changed $0 main\n")
+        await control.start("main")
+
+        assert control.connected
+        assert mock_exec.call_args.args == (
+            "tmux",
+            "-C",
+            "attach-session",
+            "-f",
+            "no-output,ignore-size",
+            "-t",
+            "main",
+        )
+
+        task = asyncio.create_task(control.run("send-keys", "-t", "%1", "it's"))
+        await asyncio.sleep(0)
+        proc.stdin.write.assert_called_with(b"'send-keys' '-t' '%1' 'it'\\''s'\n")
+        # Output lines starting with '%' inside a block are payload, not notifications.
+        proc.stdout.feed_data(b"%begin 2 2 1\n%1\n%end 2 2 1\n")
+        assert await task == (0, "%1\n", "")
+
+        task = asyncio.create_task(control.run("bogus"))
+        await asyncio.sleep(0)
+        proc.stdout.feed_data(b"%begin 3 3 1\nunknown command: bogus\n%error 3 3 1\n")
+        assert await task == (1, "", "unknown command: bogus\n")
+
+        assert control.supports(("send-keys", "a;b"))
+        assert not control.supports(("send-keys", "a\nb"))
+
+        task = asyncio.create_task(control.run("list-panes"))
+        await asyncio.sleep(0)
+        proc.stdout.feed_eof()
+        with pytest.raises(tmux.TmuxError, match="closed"):
+            await task
+        assert not control.connected
+        assert not control.supports(("list-panes",))
+
+        await control.stop()
+        proc.stdin.close.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_tmux_control_mode_attach_failure():
+    proc = _FakeControlProc()
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+        control = tmux.TmuxControl()
+        proc.stdout.feed_data(b"%begin 1 1 0\ncan't find session: nope\n%error 1 1 0\n")
+        with pytest.raises(tmux.TmuxError, match="can't find session"):
+            await control.start("nope")
+        assert not control.connected
+
+        with pytest.raises(tmux.TmuxError):
+            await control.run("list-panes")
+
+
+# --- rumble tests ---
 
-            # Should write pattern then 0,0 to stop
-            expected_payload = struct.pack(">HH", 0xFFFF, 50)
-            stop_payload = struct.pack(">HH", 0, 0)
 
-            # Check calls to write
-            calls = [c.args[0] for c in mock_file.write.call_args_list]
-            assert expected_payload in calls
-            assert stop_payload in calls
+@pytest.fixture
+def rumble_fifo_path(tmp_path: Path):
+    """A real FIFO the RumbleManager under test writes to."""
+    path = tmp_path / "rumble.fifo"
+    os.mkfifo(path)
+    with patch("gamux.rumble.rumble_fifo", return_value=path):
+        yield path
+
+
+def _open_reader(path: Path) -> int:
+    return os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+
+
+@pytest.mark.asyncio
+async def test_rumble_manager_play(rumble_fifo_path):
+    config = RumbleConfig(enabled=True, patterns={"test": [(0xFFFF, 50)]})
+    manager = RumbleManager(config)
+    reader = _open_reader(rumble_fifo_path)
+    try:
+        await manager.play("test")
+        await manager.play("test")
+        await manager._queue.join()
+
+        # Should write pattern then 0,0 to stop, twice, over one kept-open fd
+        expected_payload = struct.pack(">HH", 0xFFFF, 50)
+        stop_payload = struct.pack(">HH", 0, 0)
+        assert os.read(reader, 64) == (expected_payload + stop_payload) * 2
+        assert manager._fd is not None
+    finally:
+        await manager.stop()
+        os.close(reader)
 
 
 @pytest.mark.asyncio
@@ -127,58 +294,115 @@ async def test_rumble_manager_unknown_pattern():
 
 
 @pytest.mark.asyncio
-async def test_rumble_manager_stop():
+async def test_rumble_manager_stop(rumble_fifo_path):
     config = RumbleConfig(enabled=True)
-    with patch("gamux.rumble.rumble_fifo") as mock_fifo_path:
-        mock_path = MagicMock(spec=Path)
-        mock_path.exists.return_value = True
-        mock_fifo_path.return_value = mock_path
-        manager = RumbleManager(config)
-
-        with patch.object(mock_path, "open") as mock_open:
-            mock_file = MagicMock()
-            mock_open.return_value.__enter__.return_value = mock_file
-            await manager.stop()
+    manager = RumbleManager(config)
+    reader = _open_reader(rumble_fifo_path)
+    try:
+        await manager.stop()
 
-            stop_payload = struct.pack(">HH", 0, 0)
-            mock_file.write.assert_called_with(stop_payload)
+        stop_payload = struct.pack(">HH", 0, 0)
+        assert os.read(reader, 64) == stop_payload
+        assert manager._fd is None
+    finally:
+        os.close(reader)
 
 
 @pytest.mark.asyncio
-async def test_rumble_manager_fifo_missing():
+async def test_rumble_manager_fifo_missing(tmp_path: Path):
     config = RumbleConfig(enabled=True)
-    with patch("gamux.rumble.rumble_fifo") as mock_fifo_path:
-        mock_path = MagicMock(spec=Path)
-        mock_path.exists.return_value = False
-        mock_fifo_path.return_value = mock_path
+    with patch("gamux.rumble.rumble_fifo", return_value=tmp_path / "missing.fifo"):
         manager = RumbleManager(config)
         await manager.play("short")
+        await manager._queue.join()
         # Should return silently
+        assert manager._fd is None
 
 
 @pytest.mark.asyncio
-async def test_rumble_manager_oserror():
-    config = RumbleConfig(enabled=True)
-    with patch("gamux.rumble.rumble_fifo") as mock_fifo_path:
-        mock_path = MagicMock(spec=Path)
-        mock_path.exists.return_value = True
-        mock_path.open.side_effect = OSError("Access denied")
-        mock_fifo_path.return_value = mock_path
+async def test_rumble_manager_oserror(rumble_fifo_path):
+    config = RumbleConfig(enabled=True, patterns={"tap": [(0x1000, 0)]})
+    manager = RumbleManager(config)
 
-        manager = RumbleManager(config)
-        await manager.play("short")
-        # Should catch OSError and return silently
+    async def play_tap() -> None:
+        await manager.play("tap")
+        await manager._queue.join()
+
+    # No bridge reading the FIFO: non-blocking open fails (ENXIO), silently
+    await play_tap()
+    assert manager._fd is None
+
+    # Reader appears, then goes away mid-session (EPIPE): reopen on the next send
+    reader = _open_reader(rumble_fifo_path)
+    await play_tap()
+    os.close(reader)
+    await play_tap()
+    assert manager._fd is None
+
+    reader = _open_reader(rumble_fifo_path)
+    try:
+        await play_tap()
+        assert os.read(reader, 64) == struct.pack(">HHHH", 0x1000, 0, 0, 0)
+    finally:
+        await manager.stop()
+        os.close(reader)
+
+
+@pytest.mark.asyncio
+async def test_rumble_manager_joins_frames_without_holds(rumble_fifo_path):
+    config = RumbleConfig(enabled=True, patterns={"burst": [(1, 0), (2, 0), (3, 20), (4, 0)]})
+    manager = RumbleManager(config)
+    frames = [struct.pack(">HH", m, d) for m, d in [(1, 0), (2, 0), (3, 20), (4, 0), (0, 0)]]
+    assert manager._payloads["burst"] == (
+        (frames[0] + frames[1] + frames[2], 0.02),
+        (frames[3] + frames[4], 0.0),
+    )
+    with pytest.raises(TypeError):
+        manager._payloads["burst"] = ()  # type: ignore[index]
+
+    reader = _open_reader(rumble_fifo_path)
+    try:
+        with patch("os.write", wraps=os.write) as mock_write:
+            await manager.play("burst")
+            await manager._queue.join()
+        assert mock_write.call_count == 2
+        assert os.read(reader, 64) == b"".join(frames)
+    finally:
+        await manager.stop()
+        os.close(reader)
+
+
+@pytest.mark.asyncio
+async def test_rumble_manager_play_does_not_wait_for_pattern(rumble_fifo_path):
+    config = RumbleConfig(enabled=True, patterns={"hold": [(0xFFFF, 5000)]})
+    manager = RumbleManager(config)
+    reader = _open_reader(rumble_fifo_path)
+    try:
+        # play() only queues; the worker writes the first frame and then holds.
+        await asyncio.wait_for(manager.play("hold"), timeout=0.1)
+        await asyncio.sleep(0)
+        assert os.read(reader, 64) == struct.pack(">HH", 0xFFFF, 5000)
+
+        # One pattern is playing; the queue fills up, then further patterns are dropped.
+        for _ in range(20):
+            await manager.play("hold")
+        assert manager._queue.qsize() == 16
+
+        # stop() cuts the hold short and discards what was queued.
+        await manager.stop()
+        assert manager._queue.empty()
+        assert os.read(reader, 64) == struct.pack(">HH", 0, 0)
+    finally:
+        os.close(reader)
 
 
 @pytest.mark.asyncio
 async def test_rumble_manager_disabled():
     config = RumbleConfig(enabled=False)
-    with patch("gamux.rumble.rumble_fifo") as mock_fifo_path:
-        mock_path = MagicMock(spec=Path)
-        mock_fifo_path.return_value = mock_path
+    with patch("gamux.rumble.rumble_fifo"), patch("os.open") as mock_open:
         manager = RumbleManager(config)
         await manager.play("short")
-        mock_path.exists.assert_not_called()
+        mock_open.assert_not_called()
 
 
 # --- status tests ---
@@ -186,7 +410,7 @@ async def test_rumble_manager_disabled():
 
 @pytest.mark.asyncio
 async def test_status_manager():
-    with patch("gamux.tmux.run") as mock_run:
+    with patch("gamux.tmux.run_no_output") as mock_run:
         manager = StatusManager(session="s", window="w")
 
         await manager.set("working")
@@ -194,15 +418,71 @@ async def test_status_manager():
         # Check tmux calls for setting status
         # 1. set-window-option -t s:w automatic-rename off
         # 2. rename-window -t s:w [Gamux] working
-        mock_run.assert_any_call("set-window-option", "-t", "s:w", "automatic-rename", "off")
-        mock_run.assert_any_call("rename-window", "-t", "s:w", "[Gamux] working")
+        mock_run.assert_any_call(
+            "set-window-option", "-t", "s:w", "automatic-rename", "off", control=True
+        )
+        mock_run.assert_any_call("rename-window", "-t", "s:w", "[Gamux] working", control=True)
 
         mock_run.reset_mock()
         # Set same message again
         await manager.set("working")
         mock_run.assert_not_called()
 
+        # A new message only renames: automatic-rename is already off
+        await manager.set("listening...")
+        mock_run.assert_called_once_with(
+            "rename-window", "-t", "s:w", "[Gamux] listening...", control=True
+        )
+
         mock_run.reset_mock()
         await manager.clear()
         # 1. set-window-option -t s:w automatic-rename on
-        mock_run.assert_called_once_with("set-window-option", "-t", "s:w", "automatic-rename", "on")
+        mock_run.assert_called_once_with(
+            "set-window-option", "-t", "s:w", "automatic-rename", "on", control=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_status_manager_dedups_automatic_rename_per_target():
+    with patch("gamux.tmux.run_no_output") as mock_run:
+        manager = StatusManager(session="s", window="w")
+        await manager.set("working")
+        await manager.clear()
+
+        # Same value, different window: the new target still gets its setting.
+        manager._target_args = ("-t", "s:x")
+        mock_run.reset_mock()
+        await manager.clear()
+        mock_run.assert_called_once_with(
+            "set-window-option", "-t", "s:x", "automatic-rename", "on", control=True
+        )
+
+
+@pytest.mark.asyncio
+async def test_status_manager_without_target(monkeypatch):
+    monkeypatch.delenv("TMUX_PANE", raising=False)
+    with patch("gamux.tmux.run_no_output") as mock_run:
+        manager = StatusManager()
+        await manager.set("ready")
+        # Untargeted commands never go to the control client.
+        mock_run.assert_any_call("set-window-option", "automatic-rename", "off", control=False)
+        mock_run.assert_any_call("rename-window", "[Gamux] ready", control=False)
+
+
+@pytest.mark.asyncio
+async def test_status_manager_targets_own_pane_over_control_mode(monkeypatch):
+    monkeypatch.setenv("TMUX_PANE", "%7")
+    control = tmux.control()
+    with (
+        patch.object(control, "supports", return_value=True),
+        patch.object(control, "run", new_callable=AsyncMock) as mock_control_run,
+        patch("gamux.tmux._run_subprocess", new_callable=AsyncMock) as mock_subprocess,
+    ):
+        mock_control_run.return_value = (0, "", "")
+        await StatusManager().set("listening...")
+
+        assert [c.args for c in mock_control_run.await_args_list] == [
+            ("set-window-option", "-t", "%7", "automatic-rename", "off"),
+            ("rename-window", "-t", "%7", "[Gamux] listening..."),
+        ]
+        mock_subprocess.assert_not_called()
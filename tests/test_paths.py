@@ -1,5 +1,7 @@
 import os
+import sys
 import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -14,17 +16,45 @@ from gamux.paths import (
 )
 
 
-def test_wsl_gateway():
+@pytest.mark.skipif(sys.byteorder != "little", reason="fixture is little-endian procfs")
+def test_wsl_gateway_from_proc_route(tmp_path: Path):
+    route = tmp_path / "route"
+    route.write_text(
+        "Iface\tDestination\tGateway \tFlags\tRefCnt\tUse\tMetric\tMask\n"
+        "eth0\t000011AC\t00000000\t0001\t0\t0\t0\t0000FFFF\n"
+        "eth1\t00000000\t010011AC\t0003\t0\t0\t200\t00000000\n"
+        "eth0\t00000000\t0100A8C0\t0003\t0\t0\t100\t00000000\n"
+    )
+    wsl_gateway.cache_clear()
+    with patch("gamux.paths._PROC_ROUTE", route), patch("subprocess.run") as mock_run:
+        # Lowest-metric default route wins.
+        assert wsl_gateway() == "192.168.0.1"
+        mock_run.assert_not_called()
+    wsl_gateway.cache_clear()
+
+
+def test_wsl_gateway(tmp_path: Path):
     # Clear cache since it's lru_cache
     wsl_gateway.cache_clear()
 
-    with patch("subprocess.run") as mock_run:
+    # Without /proc/net/route, fall back to `ip route`.
+    with (
+        patch("gamux.paths._PROC_ROUTE", tmp_path / "missing"),
+        patch("subprocess.run") as mock_run,
+    ):
         # 1. Success
         mock_run.return_value = MagicMock(
-            stdout="default via 172.17.0.1 dev eth0 proto bird\n", returncode=0
+            stdout=b"default via 172.17.0.1 dev eth0 proto bird\n", returncode=0
         )
         assert wsl_gateway() == "172.17.0.1"
 
+        # A default route without a gateway is skipped.
+        wsl_gateway.cache_clear()
+        mock_run.return_value.stdout = (
+            b"default dev wg0 scope link\ndefault via 10.0.0.1 dev eth0\n"
+        )
+        assert wsl_gateway() == "10.0.0.1"
+
         # 2. Failure
         wsl_gateway.cache_clear()
         mock_run.side_effect = FileNotFoundError()
@@ -32,18 +62,25 @@ def test_wsl_gateway():
 
 
 def test_is_wsl2():
-    with patch("pathlib.Path.read_text") as mock_read:
+    with patch("pathlib.Path.read_bytes") as mock_read:
         # 1. WSL2
-        mock_read.return_value = "Linux version 5.15.133.1-microsoft-standard-WSL2"
+        is_wsl2.cache_clear()
+        mock_read.return_value = b"Linux version 5.15.133.1-microsoft-standard-WSL2"
+        assert is_wsl2() is True
+        # Cached: /proc/version is read once
         assert is_wsl2() is True
+        assert mock_read.call_count == 1
 
         # 2. Not WSL2
-        mock_read.return_value = "Linux version 5.15.0-71-generic"
+        is_wsl2.cache_clear()
+        mock_read.return_value = b"Linux version 5.15.0-71-generic"
         assert is_wsl2() is False
 
         # 3. OSError
+        is_wsl2.cache_clear()
         mock_read.side_effect = OSError()
         assert is_wsl2() is False
+    is_wsl2.cache_clear()
 
 
 def test_runtime_dir_xdg(monkeypatch: pytest.MonkeyPatch) -> None:
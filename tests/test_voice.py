@@ -8,9 +8,16 @@ import numpy as np
 import pytest
 
 from gamux.config import VoiceConfig
-from gamux.voice.recognizer import VoiceRecognizer
-from gamux.voice.source import BridgeSource, LocalSource
-from gamux.voice.vad import VADConfig, VADState, VoiceActivityDetector
+from gamux.voice.recognizer import VoiceRecognizer, _as_float32, _get_model_unlocked
+from gamux.voice.source import (
+    _BRIDGE_BACKLOG,
+    _MAX_BACKLOG_CHUNKS,
+    _RING_SLOTS,
+    CHUNK_SAMPLES,
+    BridgeSource,
+    LocalSource,
+)
+from gamux.voice.vad import VADConfig, VADState, VoiceActivityDetector, _sum_squares
 
 
 def test_vad_silence_to_speech() -> None:
@@ -29,7 +36,7 @@ def test_vad_silence_to_speech() -> None:
     result = vad.process(speech)
     assert result.speech_started
     assert vad._state == VADState.SPEECH
-    assert len(vad._buffer) == 1
+    assert vad._capture_len == 480
 
 
 def test_vad_speech_to_silence() -> None:
@@ -52,7 +59,28 @@ def test_vad_speech_to_silence() -> None:
     # 2nd silence chunk -> triggers end
     result = vad.process(silence)
     assert result.speech_ended
-    assert len(result.audio_buffer) == 3  # speech + 2 silence
+    assert result.audio.dtype == np.float32
+    assert result.audio.size == 3 * 480  # speech + 2 silence
+    np.testing.assert_array_equal(result.audio[:480], speech)
+    assert vad._state == VADState.SILENCE
+
+    # The emitted audio is not overwritten by the next utterance.
+    vad.process(np.full(480, 0.5, dtype=np.float32))
+    np.testing.assert_array_equal(result.audio[:480], speech)
+
+
+def test_vad_ends_utterance_when_capture_is_full() -> None:
+    """An utterance that fills the capture buffer is emitted, not grown."""
+    config = VADConfig(threshold=0.1, min_speech_ms=0, max_utterance_ms=90)  # 3 chunks
+    vad = VoiceActivityDetector(config)
+    speech = np.ones(480, dtype=np.float32)
+
+    for _ in range(3):
+        assert not vad.process(speech).speech_ended
+    result = vad.process(speech)
+
+    assert result.speech_ended
+    assert result.audio.size == 3 * 480
     assert vad._state == VADState.SILENCE
 
 
@@ -72,6 +100,31 @@ def test_vad_min_speech_duration() -> None:
     assert vad._state == VADState.SILENCE
 
 
+def test_vad_adaptive_threshold_ignores_quieter_than_recent_peak() -> None:
+    """Energy above the floor but well below the recent peak is not speech."""
+    vad = VoiceActivityDetector(VADConfig(threshold=0.1, mu=0.5, min_speech_ms=0))
+
+    assert vad.process(np.ones(480, dtype=np.float32)).speech_started
+    vad.reset()
+
+    # 0.3 clears the 0.1 floor but not 0.5 * the ~1.0 peak seen a chunk ago.
+    result = vad.process(np.full(480, 0.3, dtype=np.float32))
+    assert not result.speech_started
+    assert vad._state == VADState.SILENCE
+
+    # With the adaptive gate disabled the same chunk counts as speech.
+    fixed = VoiceActivityDetector(VADConfig(threshold=0.1, mu=0.0, min_speech_ms=0))
+    fixed.process(np.ones(480, dtype=np.float32))
+    fixed.reset()
+    assert fixed.process(np.full(480, 0.3, dtype=np.float32)).speech_started
+
+
+def test_sum_squares_matches_numpy() -> None:
+    """The VAD energy kernel (JIT or numpy fallback) matches a plain sum of squares."""
+    chunk = np.linspace(-1.0, 1.0, 480, dtype=np.float32)
+    assert _sum_squares(chunk) == pytest.approx(float(np.sum(chunk.astype(np.float64) ** 2)))
+
+
 @pytest.mark.asyncio
 async def test_recognizer_transcribe() -> None:
     """Test VoiceRecognizer calling faster-whisper."""
@@ -83,7 +136,8 @@ async def test_recognizer_transcribe() -> None:
     mock_segment.text = " hello world "
     mock_model.transcribe.return_value = ([mock_segment], None)
 
-    with patch("faster_whisper.WhisperModel", return_value=mock_model):
+    _get_model_unlocked.cache_clear()
+    with patch("faster_whisper.WhisperModel", return_value=mock_model) as mock_whisper_model:
         await recognizer.load_model()
 
         callback = AsyncMock()
@@ -94,12 +148,34 @@ async def test_recognizer_transcribe() -> None:
         await recognizer.shutdown()
 
         callback.assert_called_once_with("hello world")
+        mock_model.transcribe.assert_called_once_with(
+            audio, language="en", beam_size=5, vad_filter=False
+        )
+
+        # Another recognizer for the same model reuses the loaded instance.
+        other = VoiceRecognizer(config)
+        await other.load_model()
+        await other.shutdown()
+        assert other._model is recognizer._model
+        mock_whisper_model.assert_called_once_with("tiny", compute_type="float32")
+    _get_model_unlocked.cache_clear()
+
+
+def test_as_float32() -> None:
+    """float32 audio passes through; int16 PCM is scaled into [-1.0, 1.0)."""
+    audio = np.zeros(4, dtype=np.float32)
+    assert _as_float32(audio) is audio
+
+    pcm = np.array([-32768, 0, 16384, 32767], dtype=np.int16)
+    converted = _as_float32(pcm)
+    assert converted.dtype == np.float32
+    np.testing.assert_allclose(converted, pcm / 32768.0)
 
 
 @pytest.mark.asyncio
 async def test_local_source() -> None:
     """Test LocalSource interaction with sounddevice."""
-    with patch("sounddevice.InputStream") as mock_input_stream:
+    with patch("sounddevice.RawInputStream") as mock_input_stream:
         source = LocalSource(device="test-device")
 
         await source.start()
@@ -108,18 +184,47 @@ async def test_local_source() -> None:
         callback = kwargs["callback"]
 
         # Simulate audio chunk
-        chunk = np.random.rand(480, 1).astype(np.float32)
-        callback(chunk, 480, None, None)
+        chunk = np.random.randint(-32768, 32767, (480, 1), dtype=np.int16)
+        callback(chunk.tobytes(), 480, None, None)
 
         # Get chunk from source
         async for received_chunk in source.chunks():
-            assert np.array_equal(received_chunk, chunk[:, 0])
+            assert received_chunk.dtype == np.float32
+            assert np.array_equal(received_chunk, chunk[:, 0] / np.float32(32768.0))
             await source.stop()
 
         mock_input_stream.return_value.start.assert_called_once()
         mock_input_stream.return_value.stop.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_local_source_resumes_on_recent_audio_after_stall(caplog) -> None:
+    """A stalled consumer skips the stale backlog; a full ring drops new blocks."""
+    mock_sd = MagicMock()
+    with patch.dict("sys.modules", {"sounddevice": mock_sd}):
+        source = LocalSource()
+        await source.start()
+        callback = mock_sd.RawInputStream.call_args.kwargs["callback"]
+
+        for i in range(_RING_SLOTS + 3):
+            callback(np.full(CHUNK_SAMPLES, i, dtype=np.int16).tobytes(), CHUNK_SAMPLES, None, None)
+
+        received = []
+        async for chunk in source.chunks():
+            received.append(round(chunk[0] * 32768))
+            if len(received) == _MAX_BACKLOG_CHUNKS:
+                callback(
+                    np.full(CHUNK_SAMPLES, -1, dtype=np.int16).tobytes(),
+                    CHUNK_SAMPLES,
+                    None,
+                    None,
+                )
+                await source.stop()
+
+    assert received == [*range(_RING_SLOTS - _MAX_BACKLOG_CHUNKS, _RING_SLOTS), -1]
+    assert "skipped 48 stale and dropped 3 new" in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_bridge_source() -> None:
     """Test BridgeSource interaction with websockets."""
@@ -142,3 +247,89 @@ async def test_bridge_source() -> None:
                 assert chunk.size == 2
                 assert np.allclose(chunk, pcm16.astype(np.float32) / 32768.0)
                 break
+
+
+@pytest.mark.asyncio
+async def test_bridge_source_splits_batched_messages() -> None:
+    """BridgeSource splits a coalesced bridge message into CHUNK_SAMPLES chunks."""
+    mock_ws = AsyncMock()
+    pcm16 = np.arange(2 * CHUNK_SAMPLES, dtype=np.int16)
+    mock_ws.__aiter__.return_value = [pcm16.tobytes()]
+
+    mock_websockets = MagicMock()
+    mock_websockets.connect.return_value.__aenter__.return_value = mock_ws
+
+    with patch.dict("sys.modules", {"websockets": mock_websockets}):
+        source = BridgeSource(host="localhost", port=1234)
+        async with source:
+            received = await _take(source, 2)
+
+    assert [chunk.size for chunk in received] == [CHUNK_SAMPLES, CHUNK_SAMPLES]
+    assert np.allclose(np.concatenate(received), pcm16.astype(np.float32) / 32768.0)
+
+
+@pytest.mark.asyncio
+async def test_bridge_source_reuses_buffer_for_shorter_messages() -> None:
+    """A shorter message after a longer one yields only its own samples."""
+    mock_ws = AsyncMock()
+    long_msg = np.full(2 * CHUNK_SAMPLES, 16384, dtype=np.int16)
+    short_msg = np.array([-16384, 8192], dtype=np.int16)
+    mock_ws.__aiter__.return_value = [long_msg.tobytes(), short_msg.tobytes()]
+
+    mock_websockets = MagicMock()
+    mock_websockets.connect.return_value.__aenter__.return_value = mock_ws
+
+    with patch.dict("sys.modules", {"websockets": mock_websockets}):
+        source = BridgeSource(host="localhost", port=1234)
+        async with source:
+            received = await _take(source, 3)
+
+    assert [chunk.size for chunk in received] == [CHUNK_SAMPLES, CHUNK_SAMPLES, 2]
+    assert np.all(received[0] == 0.5)
+    np.testing.assert_array_equal(received[2], [-0.5, 0.25])
+
+
+@pytest.mark.asyncio
+async def test_bridge_source_reconnects_after_connection_error() -> None:
+    """A failed connection is retried; the stream carries on afterwards."""
+    mock_ws = AsyncMock()
+    pcm16 = np.array([1000, -1000], dtype=np.int16)
+    mock_ws.__aiter__.return_value = [pcm16.tobytes()]
+
+    connected = MagicMock()
+    connected.__aenter__.return_value = mock_ws
+    mock_websockets = MagicMock()
+    mock_websockets.connect.side_effect = [OSError("connection refused"), connected]
+
+    with patch.dict("sys.modules", {"websockets": mock_websockets}):
+        source = BridgeSource(host="localhost", port=1234, reconnect_interval=0.01)
+        async with source:
+            received = await _take(source, 1)
+
+    assert received[0].size == 2
+    assert mock_websockets.connect.call_count == 2
+    assert mock_websockets.connect.call_args.kwargs["compression"] is None
+    assert mock_websockets.connect.call_args.kwargs["open_timeout"] == 2.0
+
+
+async def _take(source: BridgeSource, n: int) -> list[np.ndarray]:
+    """First *n* chunks from *source*, copied (chunks are views into a reused buffer)."""
+    received = []
+    async for chunk in source.chunks():
+        received.append(chunk.copy())
+        if len(received) == n:
+            break
+    return received
+
+
+@pytest.mark.asyncio
+async def test_bridge_source_keeps_newest_messages_when_consumer_lags() -> None:
+    """Messages beyond the backlog evict the oldest unread ones."""
+    source = BridgeSource(host="localhost", port=1234)
+    for i in range(_BRIDGE_BACKLOG + 2):
+        source._messages.append(np.full(2, i, dtype=np.int16).tobytes())
+    source._close()
+
+    received = [int(chunk[0] * 32768) async for chunk in source.chunks()]
+
+    assert received == list(range(2, _BRIDGE_BACKLOG + 2))